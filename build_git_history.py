@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import functools
 import os
 import sys
 from pathlib import Path
@@ -22,8 +23,93 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from utils.config_loader import load_config
 from utils.logger import get_logger
-from orchestrator.version_history_orchestrator import VersionHistoryOrchestrator
+
+# Config file read when --config isn't given
+_DEFAULT_CONFIG = 'config.yaml'
+
+# Rule used above and below the end-of-run summary blocks
+_SEP = "=" * 60
+
+# Display names and reviewer instructions for --proofread-interactive output
+_PROOFREAD_CATEGORY_NAMES = {
+    'ndrappp': 'North Dakota Rules of Appellate Procedure',
+    'ndrct': 'North Dakota Rules of Court',
+    'ndsupctadminr': 'North Dakota Supreme Court Administrative Rules',
+    'ndsupctadminorder': 'North Dakota Supreme Court Administrative Orders',
+    'ndrcivp': 'North Dakota Rules of Civil Procedure',
+    'ndrcrimp': 'North Dakota Rules of Criminal Procedure',
+    'ndrjuvp': 'North Dakota Rules of Juvenile Procedure',
+    'ndrev': 'North Dakota Rules of Evidence',
+    'local': 'North Dakota Local Court Rules',
+    'admissiontopracticer': 'Rules for Admission to Practice Law',
+    'ndrcontinuinglegaled': 'Rules for Continuing Legal Education',
+    'ndrprofconduct': 'North Dakota Rules of Professional Conduct',
+    'ndrlawyerdiscipl': 'North Dakota Rules for Lawyer Discipline',
+    'ndstdsimposinglawyersanctions': 'Standards for Imposing Lawyer Sanctions',
+    'ndcodejudconduct': 'North Dakota Code of Judicial Conduct',
+    'rjudconductcomm': 'Rules of the Judicial Conduct Commission',
+    'ndrprocr': 'North Dakota Rules of Procedure',
+    'ndrlocalctpr': 'North Dakota Rules of Local Court Procedure',
+    'rltdpracticeoflawbylawstudents': 'Rules for Limited Practice of Law by Law Students',
+}
+
+_PROOFREAD_INSTRUCTIONS = """\
+# Proofreading Instructions
+
+Review each rule below for errors. Report only genuine errors, not stylistic preferences.
+These are published court rules — flag mistakes, not opinions.
+
+Check for:
+1. **Typos**: Misspellings, missing spaces, doubled words, wrong words
+2. **Grammar**: Subject-verb agreement, sentence fragments, clear grammatical errors
+3. **Citations**: Incorrect citation format, references to non-existent rules
+4. **Cross-references**: Rule references that appear wrong
+5. **Formatting**: Inconsistent numbering (e.g., jumps from (a) to (c)), missing subsection labels
+6. **Substantive**: Contradictory provisions, ambiguous references, potential drafting errors
+
+For each finding, note:
+- The rule number
+- Severity (ERROR for clear mistakes, WARNING for potential issues)
+- The exact text containing the error
+- What the error is
+- Suggested correction (if obvious)
+
+---
+
+"""
+
+
+def _resolve_categories(args, config: dict) -> list:
+    """Return the categories to process: --category, or every enabled one with --all."""
+    if not args.all:
+        # Single category: nothing to look up in the config
+        return [args.category]
+    return [
+        k for k, v in config.get('git', {}).get('categories', {}).items()
+        if v.get('enabled', False)
+    ]
+
+
+def _print_lines(lines) -> None:
+    """Print a block of lines with a single write to stdout."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds exactly that text.
+
+    Returns True if the file was written.
+    """
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(text, encoding='utf-8')
+    return True
 
 
 def _run_update(args, config, logger):
@@ -32,21 +118,12 @@ def _run_update(args, config, logger):
 
     # Determine categories
     combined_mode = args.all
-    if args.all:
-        categories = [
-            k for k, v in config.get('git', {}).get('categories', {}).items()
-            if v.get('enabled', False)
-        ]
-    else:
-        categories = [args.category]
+    categories = _resolve_categories(args, config)
 
     dry_run = args.dry_run
 
     if dry_run:
-        print("=" * 60)
-        print("DRY RUN — no changes will be applied")
-        print("=" * 60)
-        print()
+        _print_lines([_SEP, "DRY RUN — no changes will be applied", _SEP, ""])
 
     if combined_mode:
         print(f"Updating combined repo: {', '.join(categories)}")
@@ -58,6 +135,7 @@ def _run_update(args, config, logger):
     orchestrator = UpdateOrchestrator(
         config_path=args.config,
         logger=logger,
+        config=config,
     )
 
     has_errors = False
@@ -67,28 +145,28 @@ def _run_update(args, config, logger):
             print(f"--- Updating: {category} ---")
             stats = orchestrator.update_category(category, combined_mode=combined_mode, dry_run=dry_run)
 
-            print()
-            print("=" * 60)
-            if dry_run:
-                print(f"DRY RUN COMPLETE: {category}")
-            else:
-                print(f"UPDATE COMPLETE: {category}")
-            print("=" * 60)
-            print(f"Unchanged:    {stats['skipped']}")
-            print(f"Corrections:  {stats.get('corrections_found', 0)}")
-            print(f"Amended:      {stats['amended']}")
-            print(f"New amendments: {stats.get('new_amendments_found', 0)}")
-            print(f"New commits:  {stats['new_commits']}")
-            print(f"Duration:     {stats.get('duration_seconds', 0):.1f}s")
-
-            if stats['errors']:
+            get = stats.get
+            errors = stats['errors']
+            lines = [
+                "",
+                _SEP,
+                f"DRY RUN COMPLETE: {category}" if dry_run else f"UPDATE COMPLETE: {category}",
+                _SEP,
+                f"Unchanged:    {stats['skipped']}",
+                f"Corrections:  {get('corrections_found', 0)}",
+                f"Amended:      {stats['amended']}",
+                f"New amendments: {get('new_amendments_found', 0)}",
+                f"New commits:  {stats['new_commits']}",
+                f"Duration:     {get('duration_seconds', 0):.1f}s",
+            ]
+
+            if errors:
                 has_errors = True
-                print(f"Errors:      {len(stats['errors'])}")
-                for err in stats['errors']:
-                    print(f"  - {err}")
+                lines.append(f"Errors:      {len(errors)}")
+                lines.extend(f"  - {err}" for err in errors)
 
-            print("=" * 60)
-            print()
+            lines += [_SEP, ""]
+            _print_lines(lines)
 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -114,13 +192,7 @@ def _run_fix_crossrefs(args, config, logger):
     combined_mode = args.all
     apply_mode = args.apply
 
-    if args.all:
-        categories = [
-            k for k, v in config.get('git', {}).get('categories', {}).items()
-            if v.get('enabled', False)
-        ]
-    else:
-        categories = [args.category]
+    categories = _resolve_categories(args, config)
 
     total_files = 0
     total_links = 0
@@ -144,27 +216,15 @@ def _run_fix_crossrefs(args, config, logger):
             print(f"  {category}: no cross-reference links to fix")
             continue
 
-        # Count link replacements per file
-        cat_links = 0
-        for rel_path, new_content in changes.items():
-            old_path = Path(repo_dir) / rel_path
-            old_content = old_path.read_text(encoding='utf-8')
-            # Count how many links changed
-            import difflib
-            diff_count = sum(
-                1 for line in difflib.unified_diff(
-                    old_content.splitlines(), new_content.splitlines()
-                )
-                if line.startswith('+') and not line.startswith('+++')
-            )
-            cat_links += diff_count
+        # Link replacements were counted during the scan
+        cat_links = sum(fixer.link_counts.values())
 
         total_files += len(changes)
         total_links += cat_links
 
-        print(f"  {category}: {len(changes)} files, ~{cat_links} links to fix")
-        for rel_path in sorted(changes.keys()):
-            print(f"    {rel_path}")
+        lines = [f"  {category}: {len(changes)} files, {cat_links} links to fix"]
+        lines.extend(f"    {rel_path}" for rel_path in sorted(changes))
+        _print_lines(lines)
 
         if apply_mode:
             git_mgr = GitVersionManager(
@@ -177,143 +237,124 @@ def _run_fix_crossrefs(args, config, logger):
             else:
                 print(f"  → amend FAILED")
 
-    print()
-    print("=" * 60)
-    if apply_mode:
-        print("CROSS-REFERENCE FIX APPLIED")
-    else:
-        print("CROSS-REFERENCE FIX (dry run — use --apply to amend)")
-    print("=" * 60)
-    print(f"Files changed: {total_files}")
-    print(f"Links fixed:   ~{total_links}")
-    print("=" * 60)
-    print()
+    _print_lines([
+        "",
+        _SEP,
+        "CROSS-REFERENCE FIX APPLIED" if apply_mode
+        else "CROSS-REFERENCE FIX (dry run — use --apply to amend)",
+        _SEP,
+        f"Files changed: {total_files}",
+        f"Links fixed:   {total_links}",
+        _SEP,
+        "",
+    ])
+
+
+def _check_category_mechanical(category, repo_dir, report_dir, logger=None,
+                               config_path=None, verbose=False, config=None, jobs=1):
+    """Run mechanical proofreading for one category and return its report.
+
+    Module-level so --jobs worker processes can run it; workers pass no
+    logger and build their own from the config. jobs > 1 splits the
+    category's rules across that many processes.
+    """
+    from proofreading.mechanical_checker import MechanicalChecker
+
+    if logger is None:
+        logger = get_logger(config_path, verbose, config=config)
+
+    checker = MechanicalChecker(
+        repo_dir=repo_dir,
+        category=category,
+        logger=logger,
+        report_dir=report_dir,
+        jobs=jobs,
+    )
+    return checker.run_checks()
 
 
 def _run_proofread_mechanical(args, config, logger):
     """Run local mechanical proofreading (no API calls)."""
-    import yaml
-    from proofreading.mechanical_checker import MechanicalChecker
-
     if not isinstance(config, dict):
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(args.config)
 
-    # Determine categories
-    if args.all:
-        categories = [
-            k for k, v in config.get('git', {}).get('categories', {}).items()
-            if v.get('enabled', False)
-        ]
-    else:
-        categories = [args.category]
+    categories = _resolve_categories(args, config)
 
     proof_config = config.get('proofreading', {})
     base_repo_dir = config.get('git', {}).get('repo_dir', 'data/rules')
 
+    work = []
     for category in categories:
         repo_dir = f"{base_repo_dir}/{category}"
-        report_dir = proof_config.get('report_dir') or repo_dir
+        work.append((category, repo_dir, proof_config.get('report_dir') or repo_dir))
+
+    jobs = max(1, min(args.jobs, len(work)))
+    if jobs > 1:
+        # Categories are independent and CPU-bound: check them in worker processes
+        from concurrent.futures import ProcessPoolExecutor
 
+        print(f"--- Mechanical proofreading: {len(work)} categories, {jobs} processes ---")
+        print()
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _check_category_mechanical, category, repo_dir, report_dir,
+                    config_path=args.config, verbose=args.verbose, config=config,
+                )
+                for category, repo_dir, report_dir in work
+            ]
+            # Report in category order, as the serial path does
+            for (category, _, report_dir), future in zip(work, futures):
+                _print_mechanical_summary(category, report_dir, future.result())
+        return
+
+    for category, repo_dir, report_dir in work:
         print(f"--- Mechanical proofreading: {category} ---")
         print(f"  Repo: {repo_dir}")
         print()
 
-        checker = MechanicalChecker(
-            repo_dir=repo_dir,
-            category=category,
-            logger=logger,
-            report_dir=report_dir,
+        # Reached with several categories only when --jobs is 1; a single
+        # category gets the --jobs processes for its rules instead
+        report = _check_category_mechanical(
+            category, repo_dir, report_dir, logger=logger, jobs=args.jobs,
         )
-
-        report = checker.run_checks()
-        meta = report['metadata']
-        summary = report['summary']
-
-        print()
-        print("=" * 60)
-        print(f"MECHANICAL PROOFREADING COMPLETE: {category}")
-        print("=" * 60)
-        print(f"Rules reviewed:      {meta['rules_reviewed']}")
-        print(f"Rules with findings: {meta['rules_with_findings']}")
-        print(f"Errors:              {summary['total_errors']}")
-        print(f"Warnings:            {summary['total_warnings']}")
-        print(f"Report:              {report_dir}/mechanical-proofreading-report.md")
-        print("=" * 60)
-        print()
-
-
-def _run_proofread_interactive(args, config, logger):
+        _print_mechanical_summary(category, report_dir, report)
+
+
+def _print_mechanical_summary(category, report_dir, report):
+    """Print the end-of-category summary for mechanical proofreading."""
+    meta = report['metadata']
+    summary = report['summary']
+
+    _print_lines([
+        "",
+        _SEP,
+        f"MECHANICAL PROOFREADING COMPLETE: {category}",
+        _SEP,
+        f"Rules reviewed:      {meta['rules_reviewed']}",
+        f"Rules with findings: {meta['rules_with_findings']}",
+        f"Errors:              {summary['total_errors']}",
+        f"Warnings:            {summary['total_warnings']}",
+        f"Report:              {report_dir}/mechanical-proofreading-report.md",
+        _SEP,
+        "",
+    ])
+
+
+def _run_proofread_interactive(args, config):
     """Generate files for interactive proofreading with Claude Code."""
-    import yaml
-
     if not isinstance(config, dict):
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(args.config)
 
-    # Determine categories
-    if args.all:
-        categories = [
-            k for k, v in config.get('git', {}).get('categories', {}).items()
-            if v.get('enabled', False)
-        ]
-    else:
-        categories = [args.category]
+    categories = _resolve_categories(args, config)
 
     proof_config = config.get('proofreading', {})
     base_repo_dir = config.get('git', {}).get('repo_dir', 'data/rules')
 
-    CATEGORY_NAMES = {
-        'ndrappp': 'North Dakota Rules of Appellate Procedure',
-        'ndrct': 'North Dakota Rules of Court',
-        'ndsupctadminr': 'North Dakota Supreme Court Administrative Rules',
-        'ndsupctadminorder': 'North Dakota Supreme Court Administrative Orders',
-        'ndrcivp': 'North Dakota Rules of Civil Procedure',
-        'ndrcrimp': 'North Dakota Rules of Criminal Procedure',
-        'ndrjuvp': 'North Dakota Rules of Juvenile Procedure',
-        'ndrev': 'North Dakota Rules of Evidence',
-        'local': 'North Dakota Local Court Rules',
-        'admissiontopracticer': 'Rules for Admission to Practice Law',
-        'ndrcontinuinglegaled': 'Rules for Continuing Legal Education',
-        'ndrprofconduct': 'North Dakota Rules of Professional Conduct',
-        'ndrlawyerdiscipl': 'North Dakota Rules for Lawyer Discipline',
-        'ndstdsimposinglawyersanctions': 'Standards for Imposing Lawyer Sanctions',
-        'ndcodejudconduct': 'North Dakota Code of Judicial Conduct',
-        'rjudconductcomm': 'Rules of the Judicial Conduct Commission',
-        'ndrprocr': 'North Dakota Rules of Procedure',
-        'ndrlocalctpr': 'North Dakota Rules of Local Court Procedure',
-        'rltdpracticeoflawbylawstudents': 'Rules for Limited Practice of Law by Law Students',
-    }
-
-    instructions = """\
-# Proofreading Instructions
-
-Review each rule below for errors. Report only genuine errors, not stylistic preferences.
-These are published court rules — flag mistakes, not opinions.
-
-Check for:
-1. **Typos**: Misspellings, missing spaces, doubled words, wrong words
-2. **Grammar**: Subject-verb agreement, sentence fragments, clear grammatical errors
-3. **Citations**: Incorrect citation format, references to non-existent rules
-4. **Cross-references**: Rule references that appear wrong
-5. **Formatting**: Inconsistent numbering (e.g., jumps from (a) to (c)), missing subsection labels
-6. **Substantive**: Contradictory provisions, ambiguous references, potential drafting errors
-
-For each finding, note:
-- The rule number
-- Severity (ERROR for clear mistakes, WARNING for potential issues)
-- The exact text containing the error
-- What the error is
-- Suggested correction (if obvious)
-
----
-
-"""
-
     for category in categories:
         repo_dir = f"{base_repo_dir}/{category}"
         report_dir = proof_config.get('report_dir') or repo_dir
-        category_name = CATEGORY_NAMES.get(category, category)
+        category_name = _PROOFREAD_CATEGORY_NAMES.get(category, category)
 
         # Load rules
         import glob as globmod
@@ -340,10 +381,10 @@ For each finding, note:
                 out_path = out_dir / filename
                 out_text = (
                     f"# Proofread: {category_name} — {filename}\n\n"
-                    + instructions
+                    + _PROOFREAD_INSTRUCTIONS
                     + content
                 )
-                out_path.write_text(out_text, encoding='utf-8')
+                _write_if_changed(out_path, out_text)
 
             print(f"  Wrote {len(files)} files to: {out_dir}/")
             print(f"  Usage: open files in Claude Code for interactive review")
@@ -355,7 +396,7 @@ For each finding, note:
 
             parts = [
                 f"# Proofread: {category_name}\n\n",
-                instructions,
+                _PROOFREAD_INSTRUCTIONS,
             ]
 
             for filepath in files:
@@ -368,8 +409,10 @@ For each finding, note:
                 parts.append(content)
                 parts.append("\n")
 
-            out_path.write_text(''.join(parts), encoding='utf-8')
-            print(f"  Wrote: {out_path}")
+            if _write_if_changed(out_path, ''.join(parts)):
+                print(f"  Wrote: {out_path}")
+            else:
+                print(f"  Unchanged: {out_path}")
             print(f"  Usage: open this file in Claude Code for interactive review")
 
         print()
@@ -377,21 +420,12 @@ For each finding, note:
 
 def _run_proofread_api(args, config, logger):
     """Run API-based proofreading report generation (legacy)."""
-    import yaml
     from proofreading.report_generator import ProofreadingReportGenerator
 
     if not isinstance(config, dict):
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(args.config)
 
-    # Determine categories
-    if args.all:
-        categories = [
-            k for k, v in config.get('git', {}).get('categories', {}).items()
-            if v.get('enabled', False)
-        ]
-    else:
-        categories = [args.category]
+    categories = _resolve_categories(args, config)
 
     # Create Anthropic client
     api_key = os.environ.get('ANTHROPIC_API_KEY') or config.get('anthropic', {}).get('api_key', '')
@@ -407,6 +441,8 @@ def _run_proofread_api(args, config, logger):
     model = proof_config.get('model', 'claude-sonnet-4-5-20250929')
     max_tokens = proof_config.get('max_tokens', 2000)
     temperature = proof_config.get('temperature', 0.1)
+    batch_min_rules = proof_config.get('batch_min_rules', 10)
+    concurrency = proof_config.get('concurrency', 8)
     base_repo_dir = config.get('git', {}).get('repo_dir', 'data/rules')
 
     for category in categories:
@@ -427,28 +463,37 @@ def _run_proofread_api(args, config, logger):
             max_tokens=max_tokens,
             temperature=temperature,
             report_dir=report_dir,
+            batch_min_rules=batch_min_rules,
+            concurrency=concurrency,
         )
 
         report = generator.generate_report()
         meta = report['metadata']
         summary = report['summary']
 
-        print()
-        print("=" * 60)
-        print(f"PROOFREADING COMPLETE: {category}")
-        print("=" * 60)
-        print(f"Rules reviewed:      {meta['rules_reviewed']}")
-        print(f"Rules with findings: {meta['rules_with_findings']}")
-        print(f"Errors:              {summary['total_errors']}")
-        print(f"Warnings:            {summary['total_warnings']}")
+        lines = [
+            "",
+            _SEP,
+            f"PROOFREADING COMPLETE: {category}",
+            _SEP,
+            f"Rules reviewed:      {meta['rules_reviewed']}",
+            f"Rules with findings: {meta['rules_with_findings']}",
+            f"Errors:              {summary['total_errors']}",
+            f"Warnings:            {summary['total_warnings']}",
+        ]
         if meta.get('analysis_errors'):
-            print(f"Analysis errors:     {meta['analysis_errors']}")
-        print(f"Report:              {report_dir}/proofreading-report.md")
-        print("=" * 60)
-        print()
+            lines.append(f"Analysis errors:     {meta['analysis_errors']}")
+        lines += [
+            f"Report:              {report_dir}/proofreading-report.md",
+            _SEP,
+            "",
+        ]
+        _print_lines(lines)
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Build git repository with ND Court Rules version history",
         epilog="""\
@@ -492,7 +537,6 @@ examples:
     )
     parser.add_argument(
         '--config', '-c',
-        default='config.yaml',
         help='Path to configuration file (default: config.yaml)',
     )
     parser.add_argument(
@@ -525,6 +569,13 @@ examples:
         action='store_true',
         help='Run API-based proofreading with Claude Sonnet (requires ANTHROPIC_API_KEY)',
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='With --proofread-mechanical: number of worker processes, one category '
+             'each, or splitting the rules of a single category (default: 1)',
+    )
     parser.add_argument(
         '--per-rule',
         action='store_true',
@@ -546,63 +597,73 @@ examples:
         help='With --fix-crossrefs: actually amend HEAD with fixed links (default is dry-run report only)',
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _load_run_config(args) -> dict:
+    """Parse the run's config file once, filling in args.config if omitted.
+
+    A config named with --config must exist and parse. Without one,
+    config.yaml is used; only its absence falls back to built-in defaults.
+    """
+    if args.config is not None:
+        return load_config(args.config) or {}
+
+    args.config = _DEFAULT_CONFIG
+    try:
+        return load_config(args.config) or {}
+    except FileNotFoundError:
+        print(f"Warning: Config file {args.config} not found. Using defaults.")
+        return {}
+
+
+def main():
+    args = _build_parser().parse_args()
 
-    logger = get_logger(args.config, args.verbose)
+    # Parse the config once and hand the dict to everything that needs it
+    config = _load_run_config(args)
+
+    # Interactive proofreading only writes prompt files with print() progress;
+    # don't set up logging (and open the log file) for it
+    if args.proofread_interactive:
+        _run_proofread_interactive(args, config)
+        return
+
+    logger = get_logger(args.config, args.verbose, config=config)
 
     # Update mode — separate path, uses UpdateOrchestrator
     if args.update:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
         _run_update(args, config, logger)
         return
 
     # Cross-reference fix mode
     if args.fix_crossrefs:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
         _run_fix_crossrefs(args, config, logger)
         return
 
     # Proofreading modes — separate paths, no orchestrator needed
     if args.proofread_mechanical:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
         _run_proofread_mechanical(args, config, logger)
         return
 
-    if args.proofread_interactive:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
-        _run_proofread_interactive(args, config, logger)
-        return
-
     if args.proofread_api:
-        import yaml
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
         _run_proofread_api(args, config, logger)
         return
 
+    # Build mode — imported here so the modes above (and --help) don't load
+    # requests/bs4 via the scraper modules
+    from orchestrator.version_history_orchestrator import VersionHistoryOrchestrator
+
     orchestrator = VersionHistoryOrchestrator(
         config_path=args.config,
         logger=logger,
+        config=config,
     )
 
     try:
         if args.all:
             # Combined mode: build one repo with all categories as subdirectories
-            import yaml
-            with open(args.config, 'r') as f:
-                config = yaml.safe_load(f)
-            categories = [
-                k for k, v in config.get('git', {}).get('categories', {}).items()
-                if v.get('enabled', False)
-            ]
+            categories = _resolve_categories(args, config)
             print(f"Building combined git repository: {', '.join(categories)}")
             print(f"Config: {args.config}")
             print()
@@ -612,23 +673,25 @@ examples:
                 force=args.force,
             )
 
-            print()
-            print("=" * 60)
-            print("BUILD COMPLETE: combined repository")
-            print("=" * 60)
-            print(f"Categories:         {', '.join(categories)}")
-            print(f"Rules found:        {stats['rules_found']}")
-            print(f"Rules processed:    {stats['rules_processed']}")
-            print(f"Versions committed: {stats['versions_committed']}")
-            print(f"Duration:           {stats.get('duration_seconds', 0):.1f}s")
-
-            if stats['errors']:
-                print(f"Errors:             {len(stats['errors'])}")
-                for err in stats['errors']:
-                    print(f"  - {err}")
-
-            print("=" * 60)
-            print()
+            lines = [
+                "",
+                _SEP,
+                "BUILD COMPLETE: combined repository",
+                _SEP,
+                f"Categories:         {', '.join(categories)}",
+                f"Rules found:        {stats['rules_found']}",
+                f"Rules processed:    {stats['rules_processed']}",
+                f"Versions committed: {stats['versions_committed']}",
+                f"Duration:           {stats.get('duration_seconds', 0):.1f}s",
+            ]
+
+            errors = stats['errors']
+            if errors:
+                lines.append(f"Errors:             {len(errors)}")
+                lines.extend(f"  - {err}" for err in errors)
+
+            lines += [_SEP, ""]
+            _print_lines(lines)
 
         else:
             # Single-category mode: build standalone repo in subdirectory
@@ -644,23 +707,25 @@ examples:
                     force=args.force,
                 )
 
-                print()
-                print("=" * 60)
-                print(f"BUILD COMPLETE: {category}")
-                print("=" * 60)
-                print(f"Category:           {stats['category']}")
-                print(f"Rules found:        {stats['rules_found']}")
-                print(f"Rules processed:    {stats['rules_processed']}")
-                print(f"Versions committed: {stats['versions_committed']}")
-                print(f"Duration:           {stats.get('duration_seconds', 0):.1f}s")
-
-                if stats['errors']:
-                    print(f"Errors:             {len(stats['errors'])}")
-                    for err in stats['errors']:
-                        print(f"  - {err}")
-
-                print("=" * 60)
-                print()
+                lines = [
+                    "",
+                    _SEP,
+                    f"BUILD COMPLETE: {category}",
+                    _SEP,
+                    f"Category:           {stats['category']}",
+                    f"Rules found:        {stats['rules_found']}",
+                    f"Rules processed:    {stats['rules_processed']}",
+                    f"Versions committed: {stats['versions_committed']}",
+                    f"Duration:           {stats.get('duration_seconds', 0):.1f}s",
+                ]
+
+                errors = stats['errors']
+                if errors:
+                    lines.append(f"Errors:             {len(errors)}")
+                    lines.extend(f"  - {err}" for err in errors)
+
+                lines += [_SEP, ""]
+                _print_lines(lines)
 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -3,21 +3,33 @@ Git Version Manager for ND Court Rules.
 Creates and manages a git repository with chronological commits for rule versions.
 """
 
+import json
 import os
 import subprocess
 from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
-from scraper.historical_version_fetcher import RuleVersionContent
+if TYPE_CHECKING:
+    # Annotation only — importing the scraper at runtime would pull in
+    # requests and bs4 for callers like --fix-crossrefs that never fetch
+    from scraper.historical_version_fetcher import RuleVersionContent
 
 
 class GitVersionManager:
     """Manages a git repository representing rule version history."""
 
+    # Sidecar in .git/ holding ETag/Last-Modified per rule page URL, used by
+    # update mode to make conditional requests
+    PAGE_VALIDATORS_FILE = 'ndrules-etags.json'
+
+    # Sidecar in .git/ recording the rule index a complete build was made
+    # from, so an unforced re-run can tell there is nothing new to build
+    BUILD_MANIFEST_FILE = 'ndrules-build.json'
+
     def __init__(
         self,
-        repo_dir: str,
+        repo_dir: Union[str, os.PathLike],
         author_name: str = "ND Courts System",
         author_email: str = "rules@ndcourts.gov",
         logger=None,
@@ -28,6 +40,9 @@ class GitVersionManager:
         self.author_email = author_email
         self.logger = logger
         self.category_prefix = category_prefix
+        # Rule files this manager has already `git add`ed; later commits of
+        # the same file stage it with `git commit --only` instead
+        self._tracked_files = set()
 
     def _rule_filename(self, rule_number: str) -> str:
         """Return the relative path for a rule file, respecting category_prefix."""
@@ -143,7 +158,7 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
     def process_rule_history(
         self,
         rule_number: str,
-        version_contents: List[RuleVersionContent],
+        version_contents: List['RuleVersionContent'],
     ) -> int:
         """
         Commit all versions of a rule chronologically.
@@ -207,7 +222,7 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
             filepath.write_text(markdown_content, encoding='utf-8')
-            self._run_git('add', filename)
+            paths = self._stage_rule_file(filename)
 
             # Build commit message
             date_str = effective_date.strftime('%B %d, %Y')
@@ -223,11 +238,11 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
                 body_parts.append(f"Status: {status}")
                 message = f"{subject}\n\n" + '\n'.join(body_parts)
 
-            self._commit(message=message, commit_date=effective_date)
+            self._commit(message=message, commit_date=effective_date, paths=paths)
 
             if self.logger:
                 self.logger.debug(
-                    f"Committed Rule {rule_number} version effective {effective_date}"
+                    "Committed Rule %s version effective %s", rule_number, effective_date
                 )
             return True
 
@@ -238,8 +253,34 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
                 )
             return False
 
-    def _commit(self, message: str, commit_date: Optional[date] = None) -> bool:
-        """Create a git commit with optional date override."""
+    def _stage_rule_file(self, filename: str) -> List[str]:
+        """Stage a rule file for the next commit, skipping `git add` when possible.
+
+        A file is `git add`ed the first time this manager writes it. After
+        that it is known to git, so the returned path is handed to _commit,
+        which stages and commits it in one `git commit --only` process —
+        halving the subprocesses for rules with many versions.
+
+        Returns:
+            Paths to pass to _commit (empty if the file was added here).
+        """
+        if filename in self._tracked_files:
+            return [filename]
+        if self._run_git('add', filename).returncode == 0:
+            self._tracked_files.add(filename)
+        return []
+
+    def _commit(
+        self,
+        message: str,
+        commit_date: Optional[date] = None,
+        paths: Optional[List[str]] = None,
+    ) -> bool:
+        """Create a git commit with optional date override.
+
+        If paths are given, their working-tree content is staged and
+        committed (`git commit --only`); otherwise the index is committed.
+        """
         env = os.environ.copy()
         env['GIT_AUTHOR_NAME'] = self.author_name
         env['GIT_COMMITTER_NAME'] = self.author_name
@@ -255,8 +296,11 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
             env['GIT_COMMITTER_DATE'] = date_str
 
         try:
+            cmd = ['git', 'commit', '-m', message, '--allow-empty-message']
+            if paths:
+                cmd += ['--only', '--'] + list(paths)
             result = subprocess.run(
-                ['git', 'commit', '-m', message, '--allow-empty-message'],
+                cmd,
                 cwd=str(self.repo_dir),
                 env=env,
                 capture_output=True,
@@ -336,6 +380,116 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
                 )
             return None
 
+    def get_rule_effective_dates(self) -> Dict[str, Optional[date]]:
+        """Get the effective date of every rule file in one pass over git log.
+
+        Gives the same answers as get_rule_effective_date() for each rule,
+        but walks the history once instead of running git log per file:
+        newest first, the first commit that lists a file is its latest.
+
+        Returns:
+            Mapping of rule number to effective date (None if the author
+            date could not be parsed). Rules with no commits are absent.
+        """
+        if self.category_prefix:
+            pathspec = f"{self.category_prefix}/"
+            name_prefix = f"{self.category_prefix}/rule-"
+        else:
+            pathspec = "."
+            name_prefix = "rule-"
+
+        result = self._run_git(
+            'log', '--no-renames', '--name-only', '--format=%x00%aI', '--', pathspec
+        )
+        dates: Dict[str, Optional[date]] = {}
+        if result.returncode != 0:
+            return dates
+
+        commit_date = None
+        for line in result.stdout.splitlines():
+            if line.startswith('\x00'):
+                date_str = line[1:]
+                try:
+                    commit_date = datetime.fromisoformat(date_str).date()
+                except ValueError:
+                    if self.logger:
+                        self.logger.warning(f"Could not parse author date '{date_str}'")
+                    commit_date = None
+                continue
+            if not (line.startswith(name_prefix) and line.endswith('.md')):
+                continue
+            rule_number = line[len(name_prefix):-len('.md')]
+            if '/' in rule_number or rule_number in dates:
+                continue
+            dates[rule_number] = commit_date
+        return dates
+
+    def load_page_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load the HTTP validators saved for rule pages in this repo.
+
+        Stored in .git/ so they are private to this clone and disappear
+        with it on a rebuild.
+
+        Returns:
+            Mapping of rule page URL to {'etag': ..., 'last_modified': ...}
+            (either key may be missing); empty if nothing has been saved.
+        """
+        try:
+            with open(self.repo_dir / '.git' / self.PAGE_VALIDATORS_FILE, 'rb') as f:
+                validators = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            if self.logger:
+                self.logger.warning(f"Ignoring unreadable page validators: {e}")
+            return {}
+        return validators if isinstance(validators, dict) else {}
+
+    def save_page_validators(self, validators: Dict[str, Dict[str, str]]) -> None:
+        """Save rule page validators, replacing the file atomically."""
+        path = self.repo_dir / '.git' / self.PAGE_VALIDATORS_FILE
+        tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(validators, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Failed to save page validators: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def load_build_index_digest(self) -> Optional[str]:
+        """Return the rule index digest saved by the last complete build, if any."""
+        try:
+            with open(self.repo_dir / '.git' / self.BUILD_MANIFEST_FILE, 'rb') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            if self.logger:
+                self.logger.warning(f"Ignoring unreadable build manifest: {e}")
+            return None
+        return manifest.get('rule_index_sha256') if isinstance(manifest, dict) else None
+
+    def save_build_index_digest(self, digest: str) -> None:
+        """Record the rule index digest of a complete build, replacing the file atomically."""
+        path = self.repo_dir / '.git' / self.BUILD_MANIFEST_FILE
+        tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'rule_index_sha256': digest}, f, indent=1)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Failed to save build manifest: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def amend_rule_version(self, rule_number: str, markdown_content: str) -> bool:
         """Amend the most recent commit touching a rule file with new content.
 
@@ -398,7 +552,7 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
             filepath.write_text(markdown_content, encoding='utf-8')
-            self._run_git('add', filename)
+            paths = self._stage_rule_file(filename)
 
             message = (
                 f"Rule {rule_number}: Silent correction (effective date unchanged)\n\n"
@@ -406,7 +560,7 @@ All rules sourced from the [North Dakota Courts website](https://www.ndcourts.go
                 "date. Recorded at the time the change was detected."
             )
             # No commit_date override -> recorded at the real detection time.
-            return self._commit(message=message)
+            return self._commit(message=message, paths=paths)
 
         except Exception as e:
             if self.logger:
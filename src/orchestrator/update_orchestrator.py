@@ -6,12 +6,17 @@ commits for genuine amendments.
 """
 
 import difflib
+import hashlib
+import heapq
+import logging
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from pathlib import Path
 from typing import Dict, List, Optional
 
-import requests
 import yaml
 
 from scraper.version_history_extractor import VersionHistoryExtractor, VersionHistory
@@ -19,12 +24,20 @@ from scraper.historical_version_fetcher import HistoricalVersionFetcher, RuleVer
 from scraper.committee_minutes_fetcher import CommitteeMinutesFetcher
 from scraper.commit_message_builder import CommitMessageBuilder
 from scraper.rule_link_fetcher import fetch_rule_links
+from scraper.http_session import create_session
+from scraper.rule_sort import version_sort_key
 from git.git_version_manager import GitVersionManager
+from utils.config_loader import load_config
+from utils.rate_limiter import RateLimiter
 
 
 class UpdateOrchestrator:
     """Detects and applies corrections and new amendments to existing rule repos."""
 
+    # Default minimum spacing between rule-page checks in Phase A, in
+    # seconds; version_history.requests_per_second overrides it
+    _RULE_CHECK_INTERVAL = 0.5
+
     CATEGORY_NAMES = {
         'ndrappp': 'North Dakota Rules of Appellate Procedure',
         'ndrct': 'North Dakota Rules of Court',
@@ -47,27 +60,38 @@ class UpdateOrchestrator:
         'rltdpracticeoflawbylawstudents': 'Limited Practice of Law by Law Students',
     }
 
-    def __init__(self, config_path: str = "config.yaml", logger=None):
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "config.yaml", logger=None, config: Optional[dict] = None):
+        self.config = config if config is not None else self._load_config(config_path)
         self.logger = logger
-        self.session = self._create_session()
+        self.session = create_session(self.config)
 
         self.version_extractor = VersionHistoryExtractor(logger)
 
-        request_delay = self.config.get('version_history', {}).get('request_delay', 1.0)
+        # Bind each config section once; everything below reads from these
+        vh_config = self.config.get('version_history', {})
+        git_config = self.config.get('git', {})
+        anthropic_config = self.config.get('anthropic', {})
+
+        request_delay = vh_config.get('request_delay', 1.0)
         self.version_fetcher = HistoricalVersionFetcher(
             session=self.session,
             logger=logger,
             request_delay=request_delay,
+            max_workers=vh_config.get('version_workers', 1),
         )
 
-        git_config = self.config.get('git', {})
         self.git_author_name = git_config.get('author_name', 'ND Courts System')
         self.git_author_email = git_config.get('author_email', 'rules@ndcourts.gov')
         self.git_base_dir = git_config.get('repo_dir', 'data/rules')
+        self._repo_base = Path(self.git_base_dir)
+        self.category_configs = git_config.get('categories', {})
+        # Rule index URL for every known or configured category, resolved once
+        self._category_urls = {
+            category: self._resolve_category_url(category)
+            for category in {**self.CATEGORY_NAMES, **(self.category_configs or {})}
+        }
 
         # Initialize committee minutes fetcher and commit message builder
-        vh_config = self.config.get('version_history', {})
         minutes_cache_dir = vh_config.get(
             'minutes_cache_dir',
             os.path.join(self.git_base_dir, '..', 'minutes_cache'),
@@ -81,7 +105,6 @@ class UpdateOrchestrator:
         )
 
         anthropic_client = self._create_anthropic_client()
-        anthropic_config = self.config.get('anthropic', {})
 
         self.commit_message_builder = CommitMessageBuilder(
             anthropic_client=anthropic_client,
@@ -90,10 +113,28 @@ class UpdateOrchestrator:
             max_tokens=anthropic_config.get('max_tokens', 1000),
             temperature=anthropic_config.get('temperature', 0.1),
             logger=logger,
+            cache_dir=os.path.join(minutes_cache_dir, 'commit_messages'),
         )
 
         self.request_delay = request_delay
 
+        # Worker pool size and the pacing the workers share: one rule check
+        # per _RULE_CHECK_INTERVAL seconds (or requests_per_second) in Phase A,
+        # one version fetch per request_delay when applying new amendments
+        self.max_workers = int(vh_config.get('max_workers', 4) or 1)
+        requests_per_second = float(vh_config.get('requests_per_second') or 0)
+        self.rule_check_limiter = RateLimiter(
+            1.0 / requests_per_second if requests_per_second > 0 else self._RULE_CHECK_INTERVAL
+        )
+        self.version_fetch_limiter = RateLimiter(request_delay)
+
+    def _resolve_category_url(self, category: str) -> str:
+        """Rule index URL for a category: its configured base_url or the default."""
+        return (self.category_configs.get(category) or {}).get(
+            'base_url',
+            f'https://www.ndcourts.gov/legal-resources/rules/{category}'
+        )
+
     def _create_anthropic_client(self):
         """Create an Anthropic API client if an API key is available."""
         api_key = os.environ.get('ANTHROPIC_API_KEY') or self.config.get('anthropic', {}).get('api_key', '')
@@ -124,29 +165,10 @@ class UpdateOrchestrator:
 
     def _load_config(self, config_path: str) -> dict:
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_config(config_path)
         except (FileNotFoundError, yaml.YAMLError):
             return {}
 
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-        user_agent = self.config.get('scraping', {}).get(
-            'user_agent', 'ND-Court-Rules-Scraper/1.0 (Educational Project)'
-        )
-        session.headers.update({
-            'User-Agent': user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        })
-        try:
-            import certifi
-            session.verify = certifi.where()
-        except ImportError:
-            session.verify = False
-        return session
-
     def update_category(self, category: str, combined_mode: bool = False, dry_run: bool = False) -> Dict:
         """
         Check a category for minor corrections and new amendments.
@@ -171,23 +193,20 @@ class UpdateOrchestrator:
             'errors': [],
             'start_time': time.time(),
         }
+        started = time.monotonic()  # duration clock; immune to wall-clock jumps
 
-        category_config = self.config.get('git', {}).get('categories', {}).get(category, {})
-        base_url = category_config.get(
-            'base_url',
-            f'https://www.ndcourts.gov/legal-resources/rules/{category}'
-        )
+        base_url = self._category_urls.get(category) or self._resolve_category_url(category)
         category_name = self.CATEGORY_NAMES.get(category, category)
 
         if combined_mode:
-            repo_dir = self.git_base_dir
+            repo_dir = self._repo_base
             category_prefix = category
         else:
-            repo_dir = os.path.join(self.git_base_dir, category)
+            repo_dir = self._repo_base / category
             category_prefix = None
 
         # Verify the repo exists
-        if not os.path.isdir(os.path.join(repo_dir, '.git')):
+        if not (repo_dir / '.git').is_dir():
             if combined_mode:
                 error = (
                     f"Combined repository not found at {repo_dir}. "
@@ -201,7 +220,7 @@ class UpdateOrchestrator:
             if self.logger:
                 self.logger.error(error)
             stats['errors'].append(error)
-            return self._finalize_stats(stats)
+            return self._finalize_stats(stats, started)
 
         git_manager = GitVersionManager(
             repo_dir=repo_dir,
@@ -220,113 +239,64 @@ class UpdateOrchestrator:
         rule_links = fetch_rule_links(self.session, base_url, self.logger)
         if not rule_links:
             stats['errors'].append(f"No rule links found for {category}")
-            return self._finalize_stats(stats)
+            return self._finalize_stats(stats, started)
 
         if self.logger:
             self.logger.info(f"Found {len(rule_links)} rules in {category_name}")
 
         # Phase A: Scrape & Compare
-        corrections = []     # (rule_link, new_content_str)
+        corrections = []     # (rule_link, new_content_str, local_content_str)
         new_amendments = []  # (rule_link, version_history)
 
-        for i, rule_link in enumerate(rule_links):
-            rule_url = rule_link['url']
-            rule_number = rule_link['rule_number']
+        # Rule pages are independent, so they are checked on a small worker
+        # pool. The shared limiter keeps rule checks at least
+        # _RULE_CHECK_INTERVAL apart however many workers there are, and
+        # results are merged in index order so the outcome matches a serial run.
+        total = len(rule_links)
+        workers = max(1, min(self.max_workers, total))
 
-            if self.logger:
-                self.logger.info(
-                    f"Checking rule {i + 1}/{len(rule_links)}: "
-                    f"{rule_link.get('title', rule_url)}"
-                )
+        # One git log walk for every rule's local effective date, instead of
+        # a git subprocess per rule inside the workers
+        local_dates = git_manager.get_rule_effective_dates()
 
-            try:
-                # Fetch rule page and extract version history
-                response = self.session.get(rule_url, timeout=30)
-                if response.status_code != 200:
-                    stats['errors'].append(f"HTTP {response.status_code} for {rule_url}")
-                    continue
+        # ETag/Last-Modified from earlier runs, for conditional requests
+        validators = git_manager.load_page_validators()
 
-                version_history = self.version_extractor.extract_version_history(
-                    response.text, rule_url
-                )
-
-                if not version_history.versions:
-                    if self.logger:
-                        self.logger.warning(f"No versions found for {rule_url}")
-                    continue
-
-                # Normalize the rule identifier to the title-derived form used by
-                # the initial build to name files. The index slug is hyphenated
-                # (e.g. "2-1" for Rule 2.1), but files are committed as
-                # "rule-2.1.md" from version_history.rule_number. Using the slug
-                # for local lookups misses, making every dotted rule look "new".
-                # Reassigning here keeps detection consistent with the build and
-                # propagates to the correction/amendment phases via rule_link.
-                rule_number = version_history.rule_number
-                rule_link['rule_number'] = rule_number
-
-                # Get the current (latest) version from the website
-                current_version = version_history.versions[-1]  # sorted oldest-first
-
-                # Fetch current version's markdown
-                current_content = self.version_fetcher.fetch_version(
-                    current_version, version_history
-                )
-                if not current_content:
-                    stats['errors'].append(f"Failed to fetch current version of {rule_url}")
-                    continue
-
-                # Read local repo state
-                local_content = git_manager.get_current_file_content(rule_number)
-                local_date = git_manager.get_rule_effective_date(rule_number)
-
-                # Classify
-                if local_content is None:
-                    # New rule — treat like new_amendment
-                    if self.logger:
-                        self.logger.info(f"  New rule detected: {rule_number}")
-                    new_amendments.append((rule_link, version_history))
-
-                elif local_date == current_version.effective_date:
-                    if local_content == current_content.markdown:
-                        # No change
-                        if self.logger:
-                            self.logger.debug(f"  No change: Rule {rule_number}")
-                        stats['skipped'] += 1
-                    else:
-                        # Minor correction — same date, different content
-                        if self.logger:
-                            self.logger.info(
-                                f"  Minor correction detected: Rule {rule_number}"
-                            )
-                        corrections.append((rule_link, current_content.markdown))
-
-                elif local_date is not None and current_version.effective_date > local_date:
-                    # New amendment — newer effective date
-                    if self.logger:
-                        self.logger.info(
-                            f"  New amendment detected: Rule {rule_number} "
-                            f"(local: {local_date}, web: {current_version.effective_date})"
-                        )
-                    new_amendments.append((rule_link, version_history))
-
-                else:
-                    # Unexpected state (local date newer than web, or missing)
-                    if self.logger:
-                        self.logger.warning(
-                            f"  Unexpected state for Rule {rule_number}: "
-                            f"local_date={local_date}, web_date={current_version.effective_date}"
-                        )
-                    stats['skipped'] += 1
+        def check(indexed_link):
+            i, rule_link = indexed_link
+            return self._check_rule(
+                rule_link, git_manager, local_dates, validators, i, total
+            )
 
-            except Exception as e:
-                error_msg = f"Error checking {rule_url}: {e}"
-                if self.logger:
-                    self.logger.error(error_msg)
-                stats['errors'].append(error_msg)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(check, enumerate(rule_links)))
+        else:
+            results = [check(item) for item in enumerate(rule_links)]
+
+        validators_changed = False
+        for rule_link, (outcome, payload) in zip(rule_links, results):
+            if outcome == 'skip':
+                stats['skipped'] += 1
+            elif outcome == 'correction':
+                corrections.append(payload)
+            elif outcome == 'new':
+                new_amendments.append(payload)
+            elif outcome == 'error':
+                stats['errors'].append(payload)
+
+            # Keep validators only for pages known to match the local file
+            rule_url = rule_link['url']
+            page_validators = payload if outcome == 'skip' else None
+            if page_validators:
+                if validators.get(rule_url) != page_validators:
+                    validators[rule_url] = page_validators
+                    validators_changed = True
+            elif validators.pop(rule_url, None) is not None:
+                validators_changed = True
 
-            # Rate limiting
-            time.sleep(0.5)
+        if validators_changed and not dry_run:
+            git_manager.save_page_validators(validators)
 
         # Record counts for both modes
         stats['corrections_found'] = len(corrections)
@@ -334,57 +304,62 @@ class UpdateOrchestrator:
 
         # Dry-run: report and return without applying
         if dry_run:
+            # Collect the report and write it in one go rather than one
+            # print() per line; diffs for large rules run to hundreds of lines.
+            lines = []
             if corrections:
-                print()
-                print(f"--- Corrections found ({len(corrections)}) ---")
-                for rule_link, new_content in corrections:
+                lines.append("")
+                lines.append(f"--- Corrections found ({len(corrections)}) ---")
+                for rule_link, new_content, old_content in corrections:
                     rule_number = rule_link['rule_number']
-                    old_content = git_manager.get_current_file_content(rule_number) or ""
-                    diff_lines = list(difflib.unified_diff(
+                    lines.append(f"\nRule {rule_number}:")
+                    lines.append(''.join(difflib.unified_diff(
                         old_content.splitlines(keepends=True),
                         new_content.splitlines(keepends=True),
                         fromfile=f"rule-{rule_number}.md (local)",
                         tofile=f"rule-{rule_number}.md (web)",
-                    ))
-                    print(f"\nRule {rule_number}:")
-                    print(''.join(diff_lines))
+                    )))
 
             if new_amendments:
-                print()
-                print(f"--- New amendments found ({len(new_amendments)}) ---")
+                lines.append("")
+                lines.append(f"--- New amendments found ({len(new_amendments)}) ---")
                 for rule_link, version_history in new_amendments:
                     rule_number = rule_link['rule_number']
-                    local_date = git_manager.get_rule_effective_date(rule_number)
+                    local_date = local_dates.get(rule_number)
                     current_version = version_history.versions[-1]
                     if local_date:
-                        print(f"  Rule {rule_number}: local {local_date} → web {current_version.effective_date}")
+                        lines.append(f"  Rule {rule_number}: local {local_date} → web {current_version.effective_date}")
                     else:
-                        print(f"  Rule {rule_number}: new rule (web {current_version.effective_date})")
+                        lines.append(f"  Rule {rule_number}: new rule (web {current_version.effective_date})")
 
             if not corrections and not new_amendments:
-                print("\nNo corrections or new amendments detected.")
+                lines.append("\nNo corrections or new amendments detected.")
 
-            return self._finalize_stats(stats)
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+            return self._finalize_stats(stats, started)
 
         # Phase B: Apply minor corrections as new, dated commits.
         # Each correction is committed on its own file at detection time rather
         # than amended into HEAD — amending HEAD in combined mode folds the
         # change into whatever unrelated rule's commit is currently at the tip.
-        for rule_link, new_content in corrections:
+        for rule_link, new_content, old_content in corrections:
             rule_number = rule_link['rule_number']
             if self.logger:
                 self.logger.info(f"Committing correction for Rule {rule_number}")
 
-            # Log the diff
-            old_content = git_manager.get_current_file_content(rule_number) or ""
-            diff_lines = list(difflib.unified_diff(
-                old_content.splitlines(keepends=True),
-                new_content.splitlines(keepends=True),
-                fromfile=f"rule-{rule_number}.md (old)",
-                tofile=f"rule-{rule_number}.md (new)",
-            ))
-            if diff_lines and self.logger:
-                self.logger.info(f"  Diff for Rule {rule_number}:\n{''.join(diff_lines)}")
+            # Log the diff — only run difflib when the message would actually
+            # be emitted. old_content is the local file as read in Phase A.
+            if self.logger and self.logger.is_enabled_for(logging.INFO):
+                diff_text = ''.join(difflib.unified_diff(
+                    old_content.splitlines(keepends=True),
+                    new_content.splitlines(keepends=True),
+                    fromfile=f"rule-{rule_number}.md (old)",
+                    tofile=f"rule-{rule_number}.md (new)",
+                ))
+                if diff_text:
+                    self.logger.info(f"  Diff for Rule {rule_number}:\n{diff_text}")
 
             success = git_manager.commit_correction(rule_number, new_content)
             if success:
@@ -402,34 +377,217 @@ class UpdateOrchestrator:
         # Phase C: Backfill & commit new amendments
         if new_amendments:
             self._apply_new_amendments(
-                new_amendments, git_manager, stats
+                new_amendments, git_manager, local_dates, stats
+            )
+
+        return self._finalize_stats(stats, started)
+
+    def _check_rule(self, rule_link: Dict, git_manager: GitVersionManager,
+                    local_dates: Dict[str, date], validators: Dict[str, Dict],
+                    index: int, total: int) -> tuple:
+        """
+        Scrape one rule and compare it against the local repo (Phase A).
+
+        Safe to run from worker threads: it only reads the repo and
+        reports back, leaving all stats/list updates to the caller.
+
+        Args:
+            rule_link: Rule link dict from the category index; its
+                rule_number is replaced by the title-derived form
+            git_manager: Git manager for the repo being updated
+            local_dates: Rule number -> local effective date, from
+                git_manager.get_rule_effective_dates()
+            validators: Rule page URL -> saved validators, from
+                git_manager.load_page_validators()
+            index: Zero-based position of the rule, for progress logging
+            total: Number of rules in the category
+
+        Returns:
+            (outcome, payload) where outcome is 'skip' (payload: validators
+            to keep for the page, or None), 'correction' (payload:
+            (rule_link, new_markdown, local_markdown)), 'new' (payload: (rule_link,
+            version_history)), 'error' (payload: message), or None when
+            there is nothing to record
+        """
+        rule_url = rule_link['url']
+        rule_number = rule_link['rule_number']
+
+        self.rule_check_limiter.wait()
+
+        if self.logger:
+            self.logger.info(
+                "Checking rule %d/%d: %s", index + 1, total, rule_link.get('title', rule_url)
+            )
+
+        try:
+            # Fetch rule page and extract version history. A 304 to a
+            # conditional request means neither the page nor the local file
+            # has changed since they last matched. Only the headers outlive
+            # the block, so the page body is freed and the connection returned
+            # to the pool before the current version is fetched.
+            saved = validators.get(rule_url)
+            headers = self._conditional_headers(saved, git_manager)
+            with self.session.get(rule_url, timeout=30, headers=headers) as response:
+                if response.status_code == 304:
+                    if self.logger:
+                        self.logger.debug("  Not modified: %s", rule_url)
+                    return 'skip', saved
+                if response.status_code != 200:
+                    return 'error', f"HTTP {response.status_code} for {rule_url}"
+
+                page_headers = response.headers
+                version_history = self.version_extractor.extract_version_history(
+                    response.content, rule_url, encoding=response.encoding
+                )
+
+            if not version_history.versions:
+                if self.logger:
+                    self.logger.warning(f"No versions found for {rule_url}")
+                return None, None
+
+            # Normalize the rule identifier to the title-derived form used by
+            # the initial build to name files. The index slug is hyphenated
+            # (e.g. "2-1" for Rule 2.1), but files are committed as
+            # "rule-2.1.md" from version_history.rule_number. Using the slug
+            # for local lookups misses, making every dotted rule look "new".
+            # Reassigning here keeps detection consistent with the build and
+            # propagates to the correction/amendment phases via rule_link.
+            rule_number = version_history.rule_number
+            rule_link['rule_number'] = rule_number
+
+            # Get the current (latest) version from the website
+            current_version = version_history.versions[-1]  # sorted oldest-first
+
+            # Fetch current version's markdown
+            current_content = self.version_fetcher.fetch_version(
+                current_version, version_history
             )
+            if not current_content:
+                return 'error', f"Failed to fetch current version of {rule_url}"
+
+            # Read local repo state
+            local_content = git_manager.get_current_file_content(rule_number)
+            local_date = local_dates.get(rule_number)
 
-        return self._finalize_stats(stats)
+            # Classify
+            if local_content is None:
+                # New rule — treat like new_amendment
+                if self.logger:
+                    self.logger.info("  New rule detected: %s", rule_number)
+                return 'new', (rule_link, version_history)
+
+            if local_date == current_version.effective_date:
+                if local_content == current_content.markdown:
+                    # No change
+                    if self.logger:
+                        self.logger.debug("  No change: Rule %s", rule_number)
+                    return 'skip', self._page_validators(
+                        page_headers, rule_url, current_version, rule_number, local_content
+                    )
+                # Minor correction — same date, different content
+                if self.logger:
+                    self.logger.info("  Minor correction detected: Rule %s", rule_number)
+                return 'correction', (rule_link, current_content.markdown, local_content)
+
+            if local_date is not None and current_version.effective_date > local_date:
+                # New amendment — newer effective date
+                if self.logger:
+                    self.logger.info(
+                        "  New amendment detected: Rule %s (local: %s, web: %s)",
+                        rule_number, local_date, current_version.effective_date,
+                    )
+                return 'new', (rule_link, version_history)
+
+            # Unexpected state (local date newer than web, or missing)
+            if self.logger:
+                self.logger.warning(
+                    f"  Unexpected state for Rule {rule_number}: "
+                    f"local_date={local_date}, web_date={current_version.effective_date}"
+                )
+            return 'skip', None
+
+        except Exception as e:
+            error_msg = f"Error checking {rule_url}: {e}"
+            if self.logger:
+                self.logger.error(error_msg)
+            return 'error', error_msg
+
+    @staticmethod
+    def _page_validators(page_headers, rule_url: str, current_version, rule_number: str,
+                         local_content: str) -> Optional[Dict[str, str]]:
+        """
+        Validators to save for a rule page that matches its local file.
+
+        Only kept when the page itself carries the current text (so an
+        unchanged page means unchanged text) and the server sent an ETag or
+        Last-Modified. The local file's name and hash are stored alongside,
+        so a later 304 is only trusted while that file is unchanged too.
+        """
+        if current_version.url != rule_url:
+            return None
+        etag = page_headers.get('ETag')
+        last_modified = page_headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+        page_validators = {
+            'rule_number': rule_number,
+            'sha1': hashlib.sha1(local_content.encode('utf-8')).hexdigest(),
+        }
+        if etag:
+            page_validators['etag'] = etag
+        if last_modified:
+            page_validators['last_modified'] = last_modified
+        return page_validators
+
+    @staticmethod
+    def _conditional_headers(saved: Optional[Dict[str, str]],
+                             git_manager: GitVersionManager) -> Optional[Dict[str, str]]:
+        """Request headers for a conditional GET, or None to fetch unconditionally."""
+        if not saved or not saved.get('rule_number'):
+            return None
+        local_content = git_manager.get_current_file_content(saved['rule_number'])
+        if local_content is None:
+            return None
+        if hashlib.sha1(local_content.encode('utf-8')).hexdigest() != saved.get('sha1'):
+            return None
+        headers = {}
+        if saved.get('etag'):
+            headers['If-None-Match'] = saved['etag']
+        if saved.get('last_modified'):
+            headers['If-Modified-Since'] = saved['last_modified']
+        return headers or None
 
     def _apply_new_amendments(
         self,
         new_amendments: List,
         git_manager: GitVersionManager,
+        local_dates: Dict[str, date],
         stats: Dict,
     ) -> None:
-        """Collect missing versions from new amendments and commit chronologically."""
-        all_missing_versions = []
+        """
+        Collect missing versions from new amendments and commit chronologically.
+
+        local_dates is the rule number -> local effective date map from
+        Phase A. Phase B only commits corrections, which are never also new
+        amendments, so the dates are still current for these rules.
+        """
+        # Work out what is missing for every rule first (local lookups only),
+        # then fetch all of it in one pass on the worker pool. Each plan entry
+        # is either an error message or (rule_number, version_history, versions);
+        # walking the plan afterwards keeps errors in the same order as before.
+        plan = []
+        fetch_jobs = []
 
         for rule_link, version_history in new_amendments:
             rule_number = rule_link['rule_number']
-            local_date = git_manager.get_rule_effective_date(rule_number)
+            local_date = local_dates.get(rule_number)
 
             if local_date is None:
                 # New rule — all versions are missing
                 missing_versions = version_history.versions
             else:
                 # Find the anchor: the version whose effective date matches local
-                anchor_idx = None
-                for idx, v in enumerate(version_history.versions):
-                    if v.effective_date == local_date:
-                        anchor_idx = idx
-                        break
+                anchor_idx = version_history.index_of_date(local_date)
 
                 if anchor_idx is None:
                     if self.logger:
@@ -437,7 +595,7 @@ class UpdateOrchestrator:
                             f"  Could not find anchor date {local_date} in version history "
                             f"for Rule {rule_number} — skipping"
                         )
-                    stats['errors'].append(
+                    plan.append(
                         f"Anchor date {local_date} not found for Rule {rule_number}"
                     )
                     continue
@@ -453,36 +611,41 @@ class UpdateOrchestrator:
                     f"  Fetching {len(missing_versions)} new version(s) for Rule {rule_number}"
                 )
 
+            plan.append((rule_number, version_history, missing_versions))
+            fetch_jobs.extend((version, version_history) for version in missing_versions)
+
+        fetched = iter(self._fetch_versions(fetch_jobs))
+
+        # One list per rule; each is already oldest-first, as in the history
+        per_rule_versions = []
+        for entry in plan:
+            if isinstance(entry, str):
+                stats['errors'].append(entry)
+                continue
+            rule_number, version_history, missing_versions = entry
+            rule_versions = []
             for version in missing_versions:
-                content = self.version_fetcher.fetch_version(version, version_history)
+                content = next(fetched)
                 if content:
-                    all_missing_versions.append(content)
+                    rule_versions.append(content)
                 else:
                     stats['errors'].append(
                         f"Failed to fetch version {version.url} for Rule {rule_number}"
                     )
-                time.sleep(self.request_delay)
+            if rule_versions:
+                per_rule_versions.append(rule_versions)
 
-        if not all_missing_versions:
+        if not per_rule_versions:
             return
 
-        # Sort globally by (effective_date, rule_number) using same key as initial build
-        def _version_sort_key(v):
-            rn = v.rule_number
-            try:
-                return (v.effective_date, 0, float(rn), '')
-            except ValueError:
-                pass
-            parts = rn.split('-')
-            if parts[0].isdigit():
-                return (v.effective_date, 0, float(parts[0]), '-'.join(parts[1:]))
-            return (v.effective_date, 1, 0, rn)
-
-        all_missing_versions.sort(key=_version_sort_key)
+        # Merge globally by (effective_date, rule_number) using same key as
+        # initial build. heapq.merge takes ties from earlier lists first, so
+        # the order matches a stable sort of the concatenated lists.
+        all_missing_versions = heapq.merge(*per_rule_versions, key=version_sort_key)
 
         if self.logger:
             self.logger.info(
-                f"Committing {len(all_missing_versions)} new version(s) chronologically"
+                f"Committing {sum(map(len, per_rule_versions))} new version(s) chronologically"
             )
 
         # Track previous effective date per rule for commit message filtering
@@ -490,7 +653,7 @@ class UpdateOrchestrator:
         prev_dates: Dict[str, date] = {}
         for rule_link, version_history in new_amendments:
             rule_number = rule_link['rule_number']
-            local_date = git_manager.get_rule_effective_date(rule_number)
+            local_date = local_dates.get(rule_number)
             if local_date:
                 prev_dates[rule_number] = local_date
 
@@ -521,10 +684,31 @@ class UpdateOrchestrator:
 
             prev_dates[content.rule_number] = content.effective_date
 
-    def _finalize_stats(self, stats: Dict) -> Dict:
-        """Add timing info and log summary."""
+    def _fetch_versions(self, jobs: List[tuple]) -> List[Optional[RuleVersionContent]]:
+        """
+        Fetch (version, version_history) pairs on the worker pool.
+
+        Fetches start at least request_delay apart across all workers, the
+        same pacing as the old one-at-a-time loop.
+
+        Returns:
+            RuleVersionContent (or None on failure) for each job, in job order
+        """
+        def fetch(job):
+            version, version_history = job
+            self.version_fetch_limiter.wait()
+            return self.version_fetcher.fetch_version(version, version_history)
+
+        workers = max(1, min(self.max_workers, len(jobs)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(fetch, jobs))
+        return [fetch(job) for job in jobs]
+
+    def _finalize_stats(self, stats: Dict, started: float) -> Dict:
+        """Add timing info and log summary. started is the run's time.monotonic() reading."""
         stats['end_time'] = time.time()
-        stats['duration_seconds'] = stats['end_time'] - stats['start_time']
+        stats['duration_seconds'] = time.monotonic() - started
 
         if self.logger:
             self.logger.info(
@@ -3,28 +3,36 @@ Version History Orchestrator for ND Court Rules.
 Coordinates all components to build a git repository with full rule version history.
 """
 
+import hashlib
+import json
 import os
-import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List, Optional
-from urllib.parse import urljoin
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-import requests
 import yaml
-from bs4 import BeautifulSoup
 
 from scraper.version_history_extractor import VersionHistoryExtractor
 from scraper.historical_version_fetcher import HistoricalVersionFetcher
 from scraper.committee_minutes_fetcher import CommitteeMinutesFetcher
 from scraper.commit_message_builder import CommitMessageBuilder
 from scraper.rule_link_fetcher import fetch_rule_links
+from scraper.http_session import create_session
+from scraper.rule_sort import rule_number_key, version_sort_key
 from git.git_version_manager import GitVersionManager
+from utils.config_loader import load_config
+from utils.rate_limiter import RateLimiter
 
 
 class VersionHistoryOrchestrator:
     """Coordinates scraping, extraction, and git repository building."""
 
+    # Default minimum seconds between rule page fetches within a category;
+    # version_history.requests_per_second overrides it
+    _RULE_FETCH_INTERVAL = 0.5
+
     CATEGORY_NAMES = {
         'ndrappp': 'North Dakota Rules of Appellate Procedure',
         'ndrct': 'North Dakota Rules of Court',
@@ -47,28 +55,47 @@ class VersionHistoryOrchestrator:
         'rltdpracticeoflawbylawstudents': 'Limited Practice of Law by Law Students',
     }
 
-    def __init__(self, config_path: str = "config.yaml", logger=None):
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "config.yaml", logger=None, config: Optional[dict] = None):
+        self.config = config if config is not None else self._load_config(config_path)
         self.logger = logger
-        self.session = self._create_session()
+        self.session = create_session(self.config)
 
         self.version_extractor = VersionHistoryExtractor(logger)
 
-        request_delay = self.config.get('version_history', {}).get('request_delay', 1.0)
+        # Bind each config section once; everything below reads from these
+        vh_config = self.config.get('version_history', {})
+        git_config = self.config.get('git', {})
+        anthropic_config = self.config.get('anthropic', {})
+
+        request_delay = vh_config.get('request_delay', 1.0)
         self.version_fetcher = HistoricalVersionFetcher(
             session=self.session,
             logger=logger,
             request_delay=request_delay,
+            max_workers=vh_config.get('version_workers', 1),
         )
 
-        git_config = self.config.get('git', {})
         self.git_manager = None  # Initialized per category
         self.git_author_name = git_config.get('author_name', 'ND Courts System')
         self.git_author_email = git_config.get('author_email', 'rules@ndcourts.gov')
         self.git_base_dir = git_config.get('repo_dir', 'data/rules')
+        self._repo_base = Path(self.git_base_dir)
+        self.category_configs = git_config.get('categories', {})
+        # Rule index URL for every known or configured category, resolved once
+        self._category_urls = {
+            category: self._resolve_category_url(category)
+            for category in {**self.CATEGORY_NAMES, **(self.category_configs or {})}
+        }
+
+        # Rules fetched at once per category, and how far apart their page
+        # fetches start
+        self.max_workers = int(vh_config.get('max_workers', 4) or 1)
+        requests_per_second = float(vh_config.get('requests_per_second') or 0)
+        self.rule_fetch_interval = (
+            1.0 / requests_per_second if requests_per_second > 0 else self._RULE_FETCH_INTERVAL
+        )
 
         # Initialize committee minutes fetcher and commit message builder
-        vh_config = self.config.get('version_history', {})
         minutes_cache_dir = vh_config.get(
             'minutes_cache_dir',
             os.path.join(self.git_base_dir, '..', 'minutes_cache'),
@@ -82,7 +109,6 @@ class VersionHistoryOrchestrator:
         )
 
         anthropic_client = self._create_anthropic_client()
-        anthropic_config = self.config.get('anthropic', {})
 
         self.commit_message_builder = CommitMessageBuilder(
             anthropic_client=anthropic_client,
@@ -91,6 +117,14 @@ class VersionHistoryOrchestrator:
             max_tokens=anthropic_config.get('max_tokens', 1000),
             temperature=anthropic_config.get('temperature', 0.1),
             logger=logger,
+            cache_dir=os.path.join(minutes_cache_dir, 'commit_messages'),
+        )
+
+    def _resolve_category_url(self, category: str) -> str:
+        """Rule index URL for a category: its configured base_url or the default."""
+        return (self.category_configs.get(category) or {}).get(
+            'base_url',
+            f'https://www.ndcourts.gov/legal-resources/rules/{category}'
         )
 
     def _create_anthropic_client(self):
@@ -124,29 +158,10 @@ class VersionHistoryOrchestrator:
 
     def _load_config(self, config_path: str) -> dict:
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_config(config_path)
         except (FileNotFoundError, yaml.YAMLError):
             return {}
 
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-        user_agent = self.config.get('scraping', {}).get(
-            'user_agent', 'ND-Court-Rules-Scraper/1.0 (Educational Project)'
-        )
-        session.headers.update({
-            'User-Agent': user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        })
-        try:
-            import certifi
-            session.verify = certifi.where()
-        except ImportError:
-            session.verify = False
-        return session
-
     def build_git_repository(self, category: str, force: bool = False) -> Dict:
         """
         Build a complete git repository for a rule category.
@@ -155,6 +170,10 @@ class VersionHistoryOrchestrator:
             category: Category identifier (e.g., 'ndrappp')
             force: If True, rebuild even if repository exists
 
+        Without force, a repository whose last complete build used the same
+        rule index is left alone: replaying every version would only add a
+        second copy of the history. Use update mode to pick up amendments.
+
         Returns:
             Statistics dictionary
         """
@@ -166,14 +185,11 @@ class VersionHistoryOrchestrator:
             'errors': [],
             'start_time': time.time(),
         }
+        started = time.monotonic()  # duration clock; immune to wall-clock jumps
 
-        category_config = self.config.get('git', {}).get('categories', {}).get(category, {})
-        base_url = category_config.get(
-            'base_url',
-            f'https://www.ndcourts.gov/legal-resources/rules/{category}'
-        )
+        base_url = self._category_urls.get(category) or self._resolve_category_url(category)
         category_name = self.CATEGORY_NAMES.get(category, category)
-        repo_dir = os.path.join(self.git_base_dir, category)
+        repo_dir = self._repo_base / category
 
         if self.logger:
             self.logger.info(f"Building git repository for {category_name}")
@@ -194,69 +210,42 @@ class VersionHistoryOrchestrator:
         # Step 2: Fetch category page and extract rule links
         rule_links = self._fetch_rule_links(base_url)
         stats['rules_found'] = len(rule_links)
+        if not rule_links:
+            # An unreachable index page also yields no links; don't record
+            # that as a complete build over the last good digest
+            stats['errors'].append(f"No rule links found for {category}")
+            stats['end_time'] = time.time()
+            stats['duration_seconds'] = time.monotonic() - started
+            return stats
 
         if self.logger:
             self.logger.info(f"Found {len(rule_links)} rules in {category_name}")
 
-        # Step 3: Collect ALL versions across ALL rules, then sort globally by date
-        all_version_work = []
-
-        for i, rule_link in enumerate(rule_links):
-            rule_url = rule_link['url']
+        index_digest = hashlib.sha256(
+            json.dumps(rule_links, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        if not force and self.git_manager.load_build_index_digest() == index_digest:
             if self.logger:
                 self.logger.info(
-                    f"Extracting version history for rule {i + 1}/{len(rule_links)}: "
-                    f"{rule_link.get('title', rule_url)}"
-                )
-
-            try:
-                # Fetch the current rule page
-                response = self.session.get(rule_url, timeout=30)
-                if response.status_code != 200:
-                    stats['errors'].append(f"HTTP {response.status_code} for {rule_url}")
-                    continue
-
-                # Extract version history
-                version_history = self.version_extractor.extract_version_history(
-                    response.text, rule_url
+                    "Rule index unchanged since the last complete build; nothing to do "
+                    "(use --update for amendments or --force to rebuild)"
                 )
+            stats['end_time'] = time.time()
+            stats['duration_seconds'] = time.monotonic() - started
+            return stats
 
-                if not version_history.versions:
-                    if self.logger:
-                        self.logger.warning(f"No versions found for {rule_url}")
-                    stats['errors'].append(f"No versions for {rule_url}")
-                    continue
-
-                # Fetch all historical version content
-                version_contents = self.version_fetcher.fetch_all_versions(version_history)
-
-                for content in version_contents:
-                    all_version_work.append(content)
-
-                stats['rules_processed'] += 1
-
-            except Exception as e:
-                error_msg = f"Error processing {rule_url}: {e}"
-                if self.logger:
-                    self.logger.error(error_msg)
-                stats['errors'].append(error_msg)
+        # Step 3: Collect ALL versions across ALL rules, then sort globally by date
+        all_version_work = []
 
-            # Small delay between rule fetches
-            time.sleep(0.5)
+        for error, version_contents in self._collect_rules(rule_links):
+            if error:
+                stats['errors'].append(error)
+                continue
+            all_version_work.extend(version_contents)
+            stats['rules_processed'] += 1
 
         # Step 4: Sort all versions globally by effective date, then by rule number
-        def _version_sort_key(v):
-            rn = v.rule_number
-            try:
-                return (v.effective_date, 0, float(rn), '')
-            except ValueError:
-                pass
-            parts = rn.split('-')
-            if parts[0].isdigit():
-                return (v.effective_date, 0, float(parts[0]), '-'.join(parts[1:]))
-            return (v.effective_date, 1, 0, rn)
-
-        all_version_work.sort(key=_version_sort_key)
+        all_version_work.sort(key=version_sort_key)
 
         if self.logger:
             self.logger.info(
@@ -291,11 +280,20 @@ class VersionHistoryOrchestrator:
             )
             if success:
                 stats['versions_committed'] += 1
+            else:
+                # Also keeps the digest unsaved, so the next run retries the build
+                stats['errors'].append(
+                    f"Commit failed for Rule {content.rule_number} "
+                    f"version {content.effective_date}"
+                )
 
             prev_dates[content.rule_number] = content.effective_date
 
+        if not stats['errors']:
+            self.git_manager.save_build_index_digest(index_digest)
+
         stats['end_time'] = time.time()
-        stats['duration_seconds'] = stats['end_time'] - stats['start_time']
+        stats['duration_seconds'] = time.monotonic() - started
 
         if self.logger:
             self.logger.info(
@@ -325,6 +323,7 @@ class VersionHistoryOrchestrator:
             'errors': [],
             'start_time': time.time(),
         }
+        started = time.monotonic()  # duration clock; immune to wall-clock jumps
 
         repo_dir = self.git_base_dir
 
@@ -334,30 +333,35 @@ class VersionHistoryOrchestrator:
 
         # Force mode: wipe existing .git and start fresh
         import shutil
-        from pathlib import Path
-        repo_path = Path(repo_dir)
+        repo_path = self._repo_base
         if force and (repo_path / '.git').exists():
             shutil.rmtree(repo_path / '.git')
             if self.logger:
                 self.logger.info(f"Force mode: removed existing .git at {repo_dir}")
 
         # Remove nested .git dirs from old per-category repos — they prevent
-        # the parent repo from tracking files in those subdirectories
+        # the parent repo from tracking files in those subdirectories.
+        # One scandir per category dir instead of a stat() per candidate path.
+        artifacts = ('README.md', 'proofreading-report.md', 'proofreading-report.json')
         for category in categories:
-            nested_git = repo_path / category / '.git'
-            if nested_git.exists():
-                shutil.rmtree(nested_git)
+            category_path = repo_path / category
+            try:
+                with os.scandir(category_path) as it:
+                    entry_names = {entry.name for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if '.git' in entry_names:
+                shutil.rmtree(category_path / '.git')
                 if self.logger:
                     self.logger.info(f"Removed nested .git in {category}/")
             # Also remove old per-category artifacts that shouldn't be in the combined repo
-            for artifact in ['README.md', 'proofreading-report.md', 'proofreading-report.json']:
-                artifact_path = repo_path / category / artifact
-                if artifact_path.exists():
-                    artifact_path.unlink()
+            for artifact in artifacts:
+                if artifact in entry_names:
+                    (category_path / artifact).unlink()
 
         # Initialize git manager at the base dir (no category subdirectory)
         self.git_manager = GitVersionManager(
-            repo_dir=repo_dir,
+            repo_dir=repo_path,
             author_name=self.git_author_name,
             author_email=self.git_author_email,
             logger=self.logger,
@@ -373,79 +377,32 @@ class VersionHistoryOrchestrator:
         )
 
         # Collect ALL versions across ALL categories
-        # Each entry is (category, content) so we can set category_prefix per commit
+        # Each entry is (category, content) so we can set category_prefix per commit.
+        # Categories are independent, so with scraping.max_concurrency > 1 they are
+        # scraped in parallel; each worker keeps its own per-request delays.
         all_version_work: List[tuple] = []
 
-        for category in categories:
-            category_config = self.config.get('git', {}).get('categories', {}).get(category, {})
-            base_url = category_config.get(
-                'base_url',
-                f'https://www.ndcourts.gov/legal-resources/rules/{category}'
-            )
-            category_name = self.CATEGORY_NAMES.get(category, category)
-
+        max_concurrency = int(self.config.get('scraping', {}).get('max_concurrency', 1) or 1)
+        workers = max(1, min(max_concurrency, len(categories)))
+        if workers > 1:
             if self.logger:
-                self.logger.info(f"Scraping {category_name} ({category})")
-
-            rule_links = self._fetch_rule_links(base_url)
-            stats['rules_found'] += len(rule_links)
-
-            if self.logger:
-                self.logger.info(f"Found {len(rule_links)} rules in {category_name}")
-
-            for i, rule_link in enumerate(rule_links):
-                rule_url = rule_link['url']
-                if self.logger:
-                    self.logger.info(
-                        f"Extracting version history for rule {i + 1}/{len(rule_links)}: "
-                        f"{rule_link.get('title', rule_url)}"
-                    )
-
-                try:
-                    response = self.session.get(rule_url, timeout=30)
-                    if response.status_code != 200:
-                        stats['errors'].append(f"HTTP {response.status_code} for {rule_url}")
-                        continue
-
-                    version_history = self.version_extractor.extract_version_history(
-                        response.text, rule_url
-                    )
-
-                    if not version_history.versions:
-                        if self.logger:
-                            self.logger.warning(f"No versions found for {rule_url}")
-                        stats['errors'].append(f"No versions for {rule_url}")
-                        continue
-
-                    version_contents = self.version_fetcher.fetch_all_versions(version_history)
-
-                    for content in version_contents:
-                        all_version_work.append((category, content))
-
-                    stats['rules_processed'] += 1
-
-                except Exception as e:
-                    error_msg = f"Error processing {rule_url}: {e}"
-                    if self.logger:
-                        self.logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-
-                time.sleep(0.5)
+                self.logger.info(f"Scraping {len(categories)} categories with {workers} workers")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._collect_category_versions, categories))
+        else:
+            results = [self._collect_category_versions(category) for category in categories]
+
+        # Merge in category order so stats and errors read the same as a serial run
+        for category, result in zip(categories, results):
+            stats['rules_found'] += result['rules_found']
+            stats['rules_processed'] += result['rules_processed']
+            stats['errors'].extend(result['errors'])
+            all_version_work.extend((category, content) for content in result['versions'])
 
         # Sort globally by (effective_date, category, rule_number)
-        def _version_sort_key(item):
-            cat, v = item
-            rn = v.rule_number
-            try:
-                return (v.effective_date, cat, 0, float(rn), '')
-            except ValueError:
-                pass
-            parts = rn.split('-')
-            if parts[0].isdigit():
-                return (v.effective_date, cat, 0, float(parts[0]), '-'.join(parts[1:]))
-            return (v.effective_date, cat, 1, 0, rn)
-
-        all_version_work.sort(key=_version_sort_key)
+        all_version_work.sort(
+            key=lambda item: (item[1].effective_date, item[0]) + rule_number_key(item[1].rule_number)
+        )
 
         if self.logger:
             self.logger.info(
@@ -486,7 +443,7 @@ class VersionHistoryOrchestrator:
             prev_dates[date_key] = content.effective_date
 
         stats['end_time'] = time.time()
-        stats['duration_seconds'] = stats['end_time'] - stats['start_time']
+        stats['duration_seconds'] = time.monotonic() - started
 
         if self.logger:
             self.logger.info(
@@ -497,6 +454,111 @@ class VersionHistoryOrchestrator:
 
         return stats
 
+    def _collect_category_versions(self, category: str) -> Dict:
+        """
+        Scrape one category's rules and fetch all of their historical versions.
+
+        Safe to run for several categories at once: it only reads shared state
+        and returns its results instead of updating the caller's stats.
+
+        Returns:
+            Dict with keys: rules_found, rules_processed, errors, versions
+        """
+        result = {
+            'rules_found': 0,
+            'rules_processed': 0,
+            'errors': [],
+            'versions': [],
+        }
+
+        base_url = self._category_urls.get(category) or self._resolve_category_url(category)
+        category_name = self.CATEGORY_NAMES.get(category, category)
+
+        if self.logger:
+            self.logger.info(f"Scraping {category_name} ({category})")
+
+        rule_links = self._fetch_rule_links(base_url)
+        result['rules_found'] = len(rule_links)
+
+        if self.logger:
+            self.logger.info(f"Found {len(rule_links)} rules in {category_name}")
+
+        for error, version_contents in self._collect_rules(rule_links):
+            if error:
+                result['errors'].append(error)
+                continue
+            result['versions'].extend(version_contents)
+            result['rules_processed'] += 1
+
+        return result
+
+    def _collect_rules(self, rule_links: List[Dict]) -> List[Tuple[Optional[str], List]]:
+        """
+        Fetch every rule's page and all of its historical versions.
+
+        Rules are independent, so up to version_history.max_workers are
+        fetched at once. Rule page fetches still start at least
+        rule_fetch_interval apart (0.5s unless requests_per_second is set),
+        and version fetches from all workers share one limiter that starts
+        them at least request_delay apart, the pace of a serial run. Results
+        come back in rule order so the build matches a serial run.
+
+        Returns:
+            (error message or None, list of RuleVersionContent) per rule link
+        """
+        total = len(rule_links)
+        workers = max(1, min(self.max_workers, total))
+        limiter = RateLimiter(self.rule_fetch_interval)
+        version_limiter = RateLimiter(self.version_fetcher.request_delay)
+
+        def collect(indexed_link):
+            i, rule_link = indexed_link
+            limiter.wait()
+            return self._collect_rule_versions(rule_link, i, total, version_limiter)
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(collect, enumerate(rule_links)))
+        return [collect(item) for item in enumerate(rule_links)]
+
+    def _collect_rule_versions(
+        self, rule_link: Dict, index: int, total: int,
+        version_limiter: Optional[RateLimiter] = None,
+    ) -> Tuple[Optional[str], List]:
+        """Fetch one rule's page and all of its historical versions."""
+        rule_url = rule_link['url']
+        if self.logger:
+            self.logger.info(
+                "Extracting version history for rule %d/%d: %s",
+                index + 1, total, rule_link.get('title', rule_url),
+            )
+
+        try:
+            # Fetch the current rule page and extract its version history
+            with self.session.get(rule_url, timeout=30) as response:
+                if response.status_code != 200:
+                    return f"HTTP {response.status_code} for {rule_url}", []
+
+                version_history = self.version_extractor.extract_version_history(
+                    response.content, rule_url, encoding=response.encoding
+                )
+
+            if not version_history.versions:
+                if self.logger:
+                    self.logger.warning(f"No versions found for {rule_url}")
+                return f"No versions for {rule_url}", []
+
+            # Fetch all historical version content
+            return None, self.version_fetcher.fetch_all_versions(
+                version_history, limiter=version_limiter
+            )
+
+        except Exception as e:
+            error_msg = f"Error processing {rule_url}: {e}"
+            if self.logger:
+                self.logger.error(error_msg)
+            return error_msg, []
+
     def _fetch_rule_links(self, category_url: str) -> List[Dict]:
         """Fetch the category page and extract links to individual rules."""
         return fetch_rule_links(self.session, category_url, self.logger)
@@ -8,7 +8,8 @@ import re
 
 # Words valid in legal text but not in standard English dictionaries.
 # All lowercase — pyspellchecker normalizes to lowercase before lookup.
-LEGAL_TERMS = {
+# Frozen: shared by every checker, and nothing should add to it at runtime.
+LEGAL_TERMS = frozenset({
     # Latin legal terms
     'ab', 'initio', 'ad', 'hoc', 'litem', 'amicus', 'curiae', 'bona', 'fide',
     'certiorari', 'coram', 'nobis', 'de', 'facto', 'jure', 'novo', 'duces',
@@ -95,30 +96,78 @@ LEGAL_TERMS = {
 
     # Numbers/ordinals commonly seen in rules
     'th', 'st', 'nd', 'rd',
-}
+})
 
 # Regex patterns for content that should be skipped entirely during spell-check.
 # Each pattern matches a span of text that should not be split into words for checking.
-IGNORE_PATTERNS = [
-    # URLs
-    re.compile(r'https?://\S+'),
-    # Email addresses
-    re.compile(r'[\w.+-]+@[\w.-]+\.\w+'),
-    # ND citation patterns: § 28-32-01, §§ 28-32-01 through 28-32-05
-    re.compile(r'§§?\s*[\d][\d.-]*'),
-    # Rule cross-references: Rule 28(b)(2), Rule 6.1(a)
-    re.compile(r'Rule\s+[\d]+(?:[.-]\d+)*(?:\([a-zA-Z0-9]+\))*'),
-    # ND abbreviations with periods: N.D.R.Civ.P., N.D.C.C., N.D.R.Crim.P.
-    re.compile(r'N\.D\.(?:[A-Z][a-z]*\.)*(?:[A-Z]\.)*'),
-    # General dotted abbreviations: U.S.C., F.R.D., etc.
-    re.compile(r'(?:[A-Z]\.){2,}\w*\.?'),
-    # Case citations: 2024 ND 123, 456 N.W.2d 789
-    re.compile(r'\d{4}\s+ND\s+\d+'),
-    re.compile(r'\d+\s+N\.W\.\d*d?\s+\d+'),
-    # Markdown formatting: **bold**, *italic*, [links](url)
-    re.compile(r'\[([^\]]+)\]\([^)]+\)'),
-    # Markdown headers (the # characters)
-    re.compile(r'^#{1,6}\s', re.MULTILINE),
-    # Numeric patterns with hyphens/dots: dates, phone numbers, section refs
-    re.compile(r'\b\d[\d./-]+\d\b'),
+#
+# Each group below is fused into a single alternation, so the text is scanned
+# once per group rather than once per pattern. Alternatives keep their order,
+# so where two could match at the same position the earlier one still wins.
+# The groups themselves must run in order: URLs swallow a link's closing
+# parenthesis, and citations like Rule 28(b) remove parentheses, both of which
+# change what the markdown link pattern (which may span lines) matches later.
+# Section signs get a pass of their own because blanking one can bring "Rule"
+# up against a following number ("Rule §456.\n\n28"), which the Rule pattern
+# must then see. Dotted abbreviations get one too: they must see what the N.D.
+# pattern leaves behind, and must run before the case citations, which can
+# start earlier, at digits glued to a word ("recieve456 N.W.2d 789").
+#
+# A group may name a literal that every one of its matches contains; the group
+# is skipped for text without it, at the cost of one substring search. Most
+# rules contain no URL or email address. The email pattern needs it most:
+# without an @ to stop at, it rescans the rest of every word from each letter,
+# which is quadratic in word length. The other citation and markup groups have
+# no literal common to all their alternatives, so they always run.
+_IGNORE_PATTERN_GROUPS = [
+    ('://', [
+        # URLs
+        r'https?://\S+',
+    ]),
+    ('@', [
+        # Email addresses
+        r'[\w.+-]+@[\w.-]+\.\w+',
+    ]),
+    ('§', [
+        # ND citation patterns: § 28-32-01, §§ 28-32-01 through 28-32-05
+        r'§§?\s*[\d][\d.-]*',
+    ]),
+    (None, [
+        # Rule cross-references: Rule 28(b)(2), Rule 6.1(a)
+        r'Rule\s+[\d]+(?:[.-]\d+)*(?:\([a-zA-Z0-9]+\))*',
+        # ND abbreviations with periods: N.D.R.Civ.P., N.D.C.C., N.D.R.Crim.P.
+        r'N\.D\.(?:[A-Z][a-z]*\.)*(?:[A-Z]\.)*',
+    ]),
+    (None, [
+        # General dotted abbreviations: U.S.C., F.R.D., etc.
+        r'(?:[A-Z]\.){2,}\w*\.?',
+    ]),
+    (None, [
+        # Case citations: 2024 ND 123, 456 N.W.2d 789
+        r'\d{4}\s+ND\s+\d+',
+        r'\d+\s+N\.W\.\d*d?\s+\d+',
+    ]),
+    (None, [
+        # Markdown formatting: **bold**, *italic*, [links](url)
+        r'\[([^\]]+)\]\([^)]+\)',
+        # Markdown headers (the # characters)
+        r'^#{1,6}\s',
+        # Numeric patterns with hyphens/dots: dates, phone numbers, section refs
+        r'\b\d[\d./-]+\d\b',
+    ]),
 ]
+
+_SCREENED_IGNORE_PATTERNS = [
+    (literal, re.compile('|'.join(f'(?:{p})' for p in group), re.MULTILINE))
+    for literal, group in _IGNORE_PATTERN_GROUPS
+]
+
+IGNORE_PATTERNS = [pattern for _, pattern in _SCREENED_IGNORE_PATTERNS]
+
+
+def scrub_ignored(text: str) -> str:
+    """Blank out URLs, citations, abbreviations and markup skipped by spell-check."""
+    for literal, pattern in _SCREENED_IGNORE_PATTERNS:
+        if literal is None or literal in text:
+            text = pattern.sub(' ', text)
+    return text
@@ -3,17 +3,69 @@ Mechanical proofreading checker for ND Court Rules.
 Runs local-only checks (spelling, formatting, structural analysis) with zero API calls.
 """
 
-import glob
+import bisect
 import json
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from spellchecker import SpellChecker
 
-from proofreading.legal_dictionary import IGNORE_PATTERNS, LEGAL_TERMS
+from proofreading.legal_dictionary import LEGAL_TERMS, scrub_ignored
+
+# Patterns used by the checks, compiled once for every rule file
+_MARKDOWN_CHARS_RE = re.compile(r'[*#`|_\[\]()>]')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+_DOUBLED_WORD_RE = re.compile(r'\b(\w+)\s+\1\b', re.IGNORECASE)
+_LOWER_LABEL_RE = re.compile(r'\(([a-z])\)')
+_UPPER_LABEL_RE = re.compile(r'\(([A-Z])\)')
+_NUMBER_LABEL_RE = re.compile(r'\((\d+)\)')
+_RULE_REF_RE = re.compile(r'Rule\s+(\d+(?:\.\d+)?)\b')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' +([.,;:!?])')
+_MULTIPLE_SPACES_RE = re.compile(r'(?<=\S)  {2,}')
+# Header line start; [^\S\n] keeps the space after the #s on the same line
+_HEADER_RE = re.compile(r'^#{1,6}[^\S\n]', re.MULTILINE)
+_NON_BLANK_RE = re.compile(r'\S')
+_UNCLOSED_LINK_RE = re.compile(r'\[[^\]]*\]\([^)]*$', re.MULTILINE)
+# A paragraph: a run of non-empty lines, i.e. text between blank lines
+_PARAGRAPH_RE = re.compile(r'[^\n]+(?:\n[^\n]+)*')
+
+# Words that legitimately appear twice in a row ("that that", "had had")
+_DOUBLED_WORD_ALLOWED = frozenset({'that', 'had', 'do'})
+
+
+@lru_cache(maxsize=1)
+def _get_spell() -> SpellChecker:
+    """Return the process-wide spell checker with the legal supplement loaded.
+
+    Loading the English frequency list dominates checker setup, so every
+    MechanicalChecker (one per category) shares one instance. Checkers
+    only query it; nothing may add words after this returns.
+    """
+    spell = SpellChecker()
+    spell.word_frequency.load_words(LEGAL_TERMS)
+    return spell
+
+
+# Checker owned by each run_checks worker process, set by _init_rule_worker
+_worker_checker = None
+
+
+def _init_rule_worker(repo_dir: str, category: str) -> None:
+    """Build the worker process's checker (and so its spell checker) once."""
+    global _worker_checker
+    _worker_checker = MechanicalChecker(repo_dir=repo_dir, category=category)
+
+
+def _check_rule_in_worker(filename: str, content: str, rule_files: set) -> dict:
+    """Run every check on one rule in a worker process."""
+    return _worker_checker._check_rule(filename, content, rule_files)
 
 
 class MechanicalChecker:
@@ -41,17 +93,35 @@ class MechanicalChecker:
         'rltdpracticeoflawbylawstudents': 'Rules for Limited Practice of Law by Law Students',
     }
 
+    # Spelling suggestion (or None) per unknown word. Shared by every checker
+    # in the process: they all query the same spell checker, and the same
+    # misspellings recur across rules and categories.
+    _suggestions: Dict[str, Optional[str]] = {}
+
+    # Whether each lowercased word seen so far is unknown to the spell
+    # checker, shared the same way. Most of a rule's words recur in other
+    # rules, so only new ones go through unknown().
+    _unknown_verdicts: Dict[str, bool] = {}
+
+    # Rules each worker process should get at least, to pay for loading
+    # its own spell checker
+    _MIN_RULES_PER_WORKER = 4
+
     def __init__(self, repo_dir: str, category: str, logger=None,
-                 report_dir: Optional[str] = None):
+                 report_dir: Optional[str] = None, jobs: int = 1):
         self.repo_dir = repo_dir
         self.category = category
         self.logger = logger
         self.report_dir = report_dir or repo_dir
         self.category_name = self.CATEGORY_NAMES.get(category, category)
+        # Worker processes for checking this category's rules
+        self.jobs = max(1, int(jobs or 1))
+
+        # Spell checker with legal supplement, shared by all checkers
+        self.spell = _get_spell()
 
-        # Initialize spell checker with legal supplement
-        self.spell = SpellChecker()
-        self.spell.word_frequency.load_words(LEGAL_TERMS)
+        # Line index of the rule _find_context last searched (see there)
+        self._context_index = None
 
     def run_checks(self) -> dict:
         """Load all rules and run all mechanical checks. Returns report dict."""
@@ -67,35 +137,65 @@ class MechanicalChecker:
         # Collect all rule filenames for cross-reference validation
         rule_files = {Path(r[0]).stem for r in rules}  # e.g. {'rule-1', 'rule-6-1'}
 
-        per_rule = []
-        for filename, content in rules:
-            findings = []
-            findings.extend(self._check_spelling(content))
-            findings.extend(self._check_doubled_words(content))
-            findings.extend(self._check_numbering_gaps(content))
-            findings.extend(self._check_unbalanced_delimiters(content))
-            findings.extend(self._check_cross_references(content, rule_files))
-            findings.extend(self._check_whitespace(content))
-            findings.extend(self._check_empty_sections(content))
-            findings.extend(self._check_broken_markdown(content))
-            findings.extend(self._check_inconsistent_subsection_style(content))
-
-            rule_number = self._filename_to_rule_number(filename)
-            per_rule.append({
-                'filename': filename,
-                'rule_number': rule_number,
-                'has_issues': len(findings) > 0,
-                'findings': findings,
-            })
+        # Rules are checked independently, so a large category can be split
+        # across worker processes; results come back in file order
+        workers = min(self.jobs, len(rules) // self._MIN_RULES_PER_WORKER)
+        if workers > 1:
+            if self.logger:
+                self.logger.info(f"Checking with {workers} worker processes")
+            filenames, contents = zip(*rules)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_rule_worker,
+                initargs=(self.repo_dir, self.category),
+            ) as executor:
+                per_rule = list(executor.map(
+                    _check_rule_in_worker, filenames, contents, repeat(rule_files),
+                    chunksize=self._MIN_RULES_PER_WORKER,
+                ))
+            if self.logger:
+                for result in per_rule:
+                    if result['findings']:
+                        self.logger.info(
+                            f"  {result['filename']}: {len(result['findings'])} findings"
+                        )
+        else:
+            per_rule = []
+            for filename, content in rules:
+                result = self._check_rule(filename, content, rule_files)
+                per_rule.append(result)
 
-            if self.logger and findings:
-                self.logger.info(f"  {filename}: {len(findings)} findings")
+                if self.logger and result['findings']:
+                    self.logger.info(f"  {filename}: {len(result['findings'])} findings")
 
         report = self._compile_report(per_rule)
         self._write_markdown_report(report)
         self._write_json_report(report)
         return report
 
+    def _check_rule(self, filename: str, content: str, rule_files: set) -> dict:
+        """Run every check on one rule and return its per-rule result."""
+        # Scan more than one check needs, done once per rule
+        letter_labels = _LOWER_LABEL_RE.findall(content)
+
+        findings = []
+        findings.extend(self._check_spelling(content))
+        findings.extend(self._check_doubled_words(content))
+        findings.extend(self._check_numbering_gaps(content, letter_labels))
+        findings.extend(self._check_unbalanced_delimiters(content))
+        findings.extend(self._check_cross_references(content, rule_files))
+        findings.extend(self._check_whitespace(content))
+        findings.extend(self._check_empty_sections(content))
+        findings.extend(self._check_broken_markdown(content))
+        findings.extend(self._check_inconsistent_subsection_style(content, letter_labels))
+
+        return {
+            'filename': filename,
+            'rule_number': self._filename_to_rule_number(filename),
+            'has_issues': len(findings) > 0,
+            'findings': findings,
+        }
+
     # ------------------------------------------------------------------
     # Individual checks
     # ------------------------------------------------------------------
@@ -104,36 +204,36 @@ class MechanicalChecker:
         """Check spelling using pyspellchecker + legal dictionary."""
         findings = []
         # Strip content that should be ignored
-        cleaned = content
-        for pattern in IGNORE_PATTERNS:
-            cleaned = pattern.sub(' ', cleaned)
+        cleaned = scrub_ignored(content)
 
         # Remove markdown formatting characters
-        cleaned = re.sub(r'[*#`|_\[\]()>]', ' ', cleaned)
+        cleaned = _MARKDOWN_CHARS_RE.sub(' ', cleaned)
 
         # Extract words (alpha only, at least 2 chars)
-        words = re.findall(r'\b[a-zA-Z]{2,}\b', cleaned)
+        words = _WORD_RE.findall(cleaned)
 
-        # Check each unique word
+        # Check each unique word; Counter keeps first-occurrence order
         word_counts = Counter(w.lower() for w in words)
-        unknown = self.spell.unknown(word_counts.keys())
-
-        for word in sorted(unknown):
+        verdicts = self._unknown_verdicts
+        new_words = [w for w in word_counts if w not in verdicts]
+        if new_words:
+            new_unknown = self.spell.unknown(new_words)
+            for w in new_words:
+                verdicts[w] = w in new_unknown
+        # Reported in the order they first appear, like the other checks
+        unknown = [w for w in word_counts if verdicts[w]]
+        # Words written in all caps at least once (likely acronyms)
+        acronyms = {w.lower() for w in words if w.isupper()}
+
+        for word in unknown:
             # Skip single-letter and very short words
             if len(word) < 3:
                 continue
             # Skip words that are all caps (likely acronyms)
-            original_forms = [w for w in words if w.lower() == word]
-            if any(w.isupper() for w in original_forms):
+            if word in acronyms:
                 continue
 
-            candidates = self.spell.candidates(word)
-            suggestion = None
-            if candidates:
-                # Get the most likely correction
-                correction = self.spell.correction(word)
-                if correction and correction != word:
-                    suggestion = correction
+            suggestion = self._suggest(word)
 
             # Find a context line containing this word
             quote = self._find_context(content, word)
@@ -151,11 +251,10 @@ class MechanicalChecker:
     def _check_doubled_words(self, content: str) -> List[dict]:
         """Check for doubled words like 'the the'."""
         findings = []
-        pattern = re.compile(r'\b(\w+)\s+\1\b', re.IGNORECASE)
-        for match in pattern.finditer(content):
+        for match in _DOUBLED_WORD_RE.finditer(content):
             word = match.group(1).lower()
             # Skip intentional doubles (e.g. section-section patterns)
-            if word in ('that', 'had', 'do'):
+            if word in _DOUBLED_WORD_ALLOWED:
                 continue
             quote = self._find_context(content, match.group(0))
             findings.append({
@@ -167,18 +266,21 @@ class MechanicalChecker:
             })
         return findings
 
-    def _check_numbering_gaps(self, content: str) -> List[dict]:
-        """Check for gaps in lettered/numbered sequences within a rule."""
+    def _check_numbering_gaps(self, content: str,
+                              letter_matches: List[str]) -> List[dict]:
+        """Check for gaps in lettered/numbered sequences within a rule.
+
+        letter_matches are the rule's (a), (b), ... labels in order.
+        """
         findings = []
 
         # Check (a), (b), (c) sequences
-        letter_matches = re.findall(r'\(([a-z])\)', content)
         findings.extend(self._detect_sequence_gaps(
             letter_matches, 'letter', content,
         ))
 
         # Check (1), (2), (3) sequences
-        number_matches = re.findall(r'\((\d+)\)', content)
+        number_matches = _NUMBER_LABEL_RE.findall(content)
         findings.extend(self._detect_number_gaps(
             number_matches, content,
         ))
@@ -192,18 +294,18 @@ class MechanicalChecker:
         if len(items) < 2:
             return findings
 
-        for i in range(1, len(items)):
-            expected_ord = ord(items[i - 1]) + 1
-            actual_ord = ord(items[i])
+        for prev, item in zip(items, items[1:]):
+            expected_ord = ord(prev) + 1
+            actual_ord = ord(item)
             if actual_ord > expected_ord and actual_ord <= ord('z'):
                 expected_char = chr(expected_ord)
                 findings.append({
                     'severity': 'WARNING',
                     'category': 'numbering',
-                    'quote': f'({items[i - 1]}) ... ({items[i]})',
+                    'quote': f'({prev}) ... ({item})',
                     'description': (
                         f'Possible {kind} sequence gap: '
-                        f'({items[i - 1]}) jumps to ({items[i]}), '
+                        f'({prev}) jumps to ({item}), '
                         f'expected ({expected_char})'
                     ),
                     'suggestion': None,
@@ -217,17 +319,17 @@ class MechanicalChecker:
             return findings
 
         nums = [int(n) for n in items]
-        for i in range(1, len(nums)):
-            if nums[i] == nums[i - 1] + 2:
+        for prev, num in zip(nums, nums[1:]):
+            if num == prev + 2:
                 # Gap of exactly 1 — likely a skip
-                expected = nums[i - 1] + 1
+                expected = prev + 1
                 findings.append({
                     'severity': 'WARNING',
                     'category': 'numbering',
-                    'quote': f'({nums[i - 1]}) ... ({nums[i]})',
+                    'quote': f'({prev}) ... ({num})',
                     'description': (
                         f'Possible number sequence gap: '
-                        f'({nums[i - 1]}) jumps to ({nums[i]}), '
+                        f'({prev}) jumps to ({num}), '
                         f'expected ({expected})'
                     ),
                     'suggestion': None,
@@ -237,14 +339,15 @@ class MechanicalChecker:
     def _check_unbalanced_delimiters(self, content: str) -> List[dict]:
         """Check for unbalanced parentheses, brackets, and quotes per paragraph."""
         findings = []
-        paragraphs = content.split('\n\n')
 
-        for para in paragraphs:
-            if not para.strip():
+        for match in _PARAGRAPH_RE.finditer(content):
+            # Stripping only drops whitespace, so the counts below are unchanged
+            para = match.group().strip()
+            if not para:
                 continue
 
             # Skip markdown table rows
-            if para.strip().startswith('|'):
+            if para.startswith('|'):
                 continue
 
             checks = [
@@ -256,7 +359,7 @@ class MechanicalChecker:
                 closes = para.count(close_ch)
                 if opens != closes:
                     # Get first line of paragraph for context
-                    first_line = para.strip().split('\n')[0][:100]
+                    first_line = para.split('\n', 1)[0][:100]
                     findings.append({
                         'severity': 'WARNING',
                         'category': 'delimiter',
@@ -271,7 +374,7 @@ class MechanicalChecker:
             # Check straight double quotes (should be even per paragraph)
             quotes = para.count('"')
             if quotes % 2 != 0:
-                first_line = para.strip().split('\n')[0][:100]
+                first_line = para.split('\n', 1)[0][:100]
                 findings.append({
                     'severity': 'WARNING',
                     'category': 'delimiter',
@@ -287,9 +390,7 @@ class MechanicalChecker:
         """Check that Rule X references correspond to existing rule files."""
         findings = []
         # Match "Rule X" or "Rule X.Y" — standalone references
-        pattern = re.compile(r'Rule\s+(\d+(?:\.\d+)?)\b')
-
-        for match in pattern.finditer(content):
+        for match in _RULE_REF_RE.finditer(content):
             rule_ref = match.group(1)
             # Convert to filename format: "6.1" → "rule-6-1"
             file_stem = 'rule-' + rule_ref.replace('.', '-')
@@ -316,7 +417,7 @@ class MechanicalChecker:
         findings = []
 
         # Space before punctuation (but not before opening parens)
-        for match in re.finditer(r' +([.,;:!?])', content):
+        for match in _SPACE_BEFORE_PUNCT_RE.finditer(content):
             quote = self._find_context(content, match.group(0))
             findings.append({
                 'severity': 'WARNING',
@@ -327,7 +428,7 @@ class MechanicalChecker:
             })
 
         # Multiple consecutive spaces (not at start of line)
-        for match in re.finditer(r'(?<=\S)  {2,}', content):
+        for match in _MULTIPLE_SPACES_RE.finditer(content):
             quote = self._find_context(content, match.group(0))
             findings.append({
                 'severity': 'WARNING',
@@ -342,23 +443,20 @@ class MechanicalChecker:
     def _check_empty_sections(self, content: str) -> List[dict]:
         """Detect markdown headers with no content before the next header."""
         findings = []
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if not re.match(r'^#{1,6}\s', line):
-                continue
-            # Look ahead for content before next header or end
-            has_content = False
-            for j in range(i + 1, len(lines)):
-                if re.match(r'^#{1,6}\s', lines[j]):
-                    break
-                if lines[j].strip():
-                    has_content = True
-                    break
-            if not has_content:
+        # One scan finds every header; a section is empty if nothing but
+        # whitespace lies between the end of its header line and the next
+        # header (or the end of the rule)
+        header_starts = [m.start() for m in _HEADER_RE.finditer(content)]
+        next_starts = header_starts[1:] + [len(content)]
+        for start, next_start in zip(header_starts, next_starts):
+            line_end = content.find('\n', start)
+            if line_end < 0:
+                line_end = len(content)
+            if not _NON_BLANK_RE.search(content, line_end, next_start):
                 findings.append({
                     'severity': 'WARNING',
                     'category': 'empty-section',
-                    'quote': line.strip(),
+                    'quote': content[start:line_end].strip(),
                     'description': 'Header with no content following it',
                     'suggestion': None,
                 })
@@ -370,7 +468,8 @@ class MechanicalChecker:
 
         # Unclosed bold markers: odd number of ** in a line
         for line_num, line in enumerate(content.split('\n'), 1):
-            bold_count = len(re.findall(r'\*\*', line))
+            # str.count is non-overlapping, like findall: '***' holds one '**'
+            bold_count = line.count('**')
             if bold_count % 2 != 0:
                 findings.append({
                     'severity': 'WARNING',
@@ -381,7 +480,7 @@ class MechanicalChecker:
                 })
 
         # Malformed markdown links: [text]( with no closing )
-        for match in re.finditer(r'\[[^\]]*\]\([^)]*$', content, re.MULTILINE):
+        for match in _UNCLOSED_LINK_RE.finditer(content):
             findings.append({
                 'severity': 'WARNING',
                 'category': 'markdown',
@@ -392,13 +491,14 @@ class MechanicalChecker:
 
         return findings
 
-    def _check_inconsistent_subsection_style(self, content: str) -> List[dict]:
+    def _check_inconsistent_subsection_style(self, content: str,
+                                             letter_labels: List[str]) -> List[dict]:
         """Flag mixed subsection labeling styles within the same rule."""
         findings = []
 
         # Check if rule mixes (a)/(A) style
-        lower_letters = set(re.findall(r'\(([a-z])\)', content))
-        upper_letters = set(re.findall(r'\(([A-Z])\)', content))
+        lower_letters = set(letter_labels)
+        upper_letters = set(_UPPER_LABEL_RE.findall(content))
 
         # Only flag if both appear and both have multiple entries
         # (a single uppercase in parentheses could be a name reference)
@@ -423,17 +523,39 @@ class MechanicalChecker:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _suggest(self, word: str) -> Optional[str]:
+        """Return the most likely correction for an unknown word, if any.
+
+        correction() already returns None when there are no candidates, so
+        the edit-distance search runs once per word per process.
+        """
+        if word in self._suggestions:
+            return self._suggestions[word]
+        correction = self.spell.correction(word)
+        suggestion = correction if correction and correction != word else None
+        self._suggestions[word] = suggestion
+        return suggestion
+
     def _load_rules(self) -> List[Tuple[str, str]]:
         """Load all rule-*.md files from the repo directory."""
-        pattern = str(Path(self.repo_dir) / 'rule-*.md')
-        files = sorted(glob.glob(pattern))
+        # One scandir with plain name tests instead of glob's fnmatch, which
+        # would also misread brackets in repo_dir as a pattern
+        try:
+            with os.scandir(self.repo_dir) as it:
+                entries = sorted(
+                    (entry for entry in it
+                     if entry.name.startswith('rule-') and entry.name.endswith('.md')
+                     and entry.is_file()),
+                    key=lambda entry: entry.name,
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         rules = []
-        for filepath in files:
-            filename = Path(filepath).name
-            with open(filepath, 'r', encoding='utf-8') as f:
+        for entry in entries:
+            with open(entry.path, 'r', encoding='utf-8') as f:
                 content = f.read()
             if content.strip():
-                rules.append((filename, content))
+                rules.append((entry.name, content))
         return rules
 
     def _filename_to_rule_number(self, filename: str) -> str:
@@ -447,14 +569,29 @@ class MechanicalChecker:
         return stem
 
     def _find_context(self, content: str, needle: str) -> str:
-        """Find a line containing the needle and return it as context."""
+        """Find a line containing the needle and return it as context.
+
+        The checks call this once per finding, so the rule's lines, its
+        lowercased text and the newline offsets are built once per rule
+        and reused. The first case-insensitive occurrence of the needle is
+        then one find() plus a bisect, and it lies in the first line that
+        contains it: lower() never adds or removes newlines, and a needle
+        with a newline in it can't fall within one line.
+        """
+        index = self._context_index
+        if index is None or index[0] is not content:
+            lowered = content.lower()
+            newlines = [i for i, ch in enumerate(lowered) if ch == '\n']
+            index = self._context_index = (content, content.split('\n'), lowered, newlines)
+        _, lines, lowered, newlines = index
+
         needle_lower = needle.lower()
-        for line in content.split('\n'):
-            if needle_lower in line.lower():
-                stripped = line.strip()
-                if len(stripped) > 120:
-                    return stripped[:120] + '...'
-                return stripped
+        pos = -1 if '\n' in needle_lower else lowered.find(needle_lower)
+        if pos >= 0:
+            stripped = lines[bisect.bisect_left(newlines, pos)].strip()
+            if len(stripped) > 120:
+                return stripped[:120] + '...'
+            return stripped
         return needle[:100]
 
     def _empty_report(self) -> dict:
@@ -614,10 +751,10 @@ class MechanicalChecker:
             Path(self.report_dir) / 'mechanical-proofreading-report.json'
         )
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(
-            json.dumps(json_report, indent=2, ensure_ascii=False) + '\n',
-            encoding='utf-8',
-        )
+        # Stream into a large buffer rather than building the whole document as one string
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(json_report, f, indent=2, ensure_ascii=False)
+            f.write('\n')
 
         if self.logger:
             self.logger.info(f"JSON report written to {report_path}")
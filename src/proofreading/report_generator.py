@@ -7,6 +7,8 @@ Produces markdown and JSON reports for submission to the court.
 import glob
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -37,9 +39,83 @@ class ProofreadingReportGenerator:
         'rltdpracticeoflawbylawstudents': 'Rules for Limited Practice of Law by Law Students',
     }
 
+    # Tool the model must call with its findings; forced via tool_choice
+    _TOOLS = [{
+        "name": "report_findings",
+        "description": "Report proofreading findings for a court rule.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "has_issues": {
+                    "type": "boolean",
+                    "description": "Whether any issues were found",
+                },
+                "findings": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "severity": {
+                                "type": "string",
+                                "enum": ["ERROR", "WARNING"],
+                                "description": "ERROR for clear mistakes, WARNING for potential issues",
+                            },
+                            "category": {
+                                "type": "string",
+                                "enum": ["typo", "grammar", "citation", "cross-reference",
+                                         "formatting", "substantive"],
+                            },
+                            "quote": {
+                                "type": "string",
+                                "description": "The exact text containing the error",
+                            },
+                            "description": {
+                                "type": "string",
+                                "description": "What the error is",
+                            },
+                            "suggestion": {
+                                "type": "string",
+                                "description": "Suggested correction, if obvious",
+                            },
+                        },
+                        "required": ["severity", "category", "quote", "description"],
+                    },
+                },
+            },
+            "required": ["has_issues", "findings"],
+        },
+    }]
+
+    # Instructions shared by every rule, sent as the system prompt. Together
+    # with _TOOLS this is roughly 500 tokens, under Sonnet's 1024-token
+    # minimum for prompt caching, so a cache breakpoint would be ignored
+    _INSTRUCTIONS = """You are proofreading a published North Dakota court rule.
+Your job is to identify clear errors for a report to the court.
+
+IMPORTANT: Report only genuine errors and strong concerns, NOT stylistic preferences.
+These are published court rules — flag mistakes, not opinions.
+
+Check for:
+1. TYPOS: Misspellings, missing spaces, doubled words, wrong words
+2. GRAMMAR: Subject-verb agreement, sentence fragments, clear grammatical errors
+3. CITATIONS: Incorrect citation format, references to non-existent rules
+4. CROSS-REFERENCES: Rule references that appear wrong
+5. FORMATTING: Inconsistent numbering (e.g., jumps from (a) to (c)), missing subsection labels
+6. SUBSTANTIVE: Contradictory provisions, ambiguous "this" without antecedent, potential drafting errors
+
+Use the report_findings tool to report your results. If the rule has no issues, call the tool with has_issues=false and an empty findings array."""
+
+    # Seconds between status checks while a Message Batch is processing
+    _BATCH_POLL_INTERVAL = 30
+    # Retries of a failing batch status or results call, backing off from the
+    # poll interval up to _BATCH_BACKOFF_MAX seconds, before the batch is canceled
+    _BATCH_MAX_RETRIES = 5
+    _BATCH_BACKOFF_MAX = 300
+
     def __init__(self, anthropic_client, model: str, repo_dir: str,
                  category: str, logger=None, max_tokens: int = 2000,
-                 temperature: float = 0.1, report_dir: Optional[str] = None):
+                 temperature: float = 0.1, report_dir: Optional[str] = None,
+                 batch_min_rules: int = 10, concurrency: int = 8):
         self.client = anthropic_client
         self.model = model
         self.repo_dir = repo_dir
@@ -48,6 +124,11 @@ class ProofreadingReportGenerator:
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.report_dir = report_dir or repo_dir
+        # Categories with at least this many rules go through the Message
+        # Batches API; 0 always calls the API once per rule
+        self.batch_min_rules = batch_min_rules
+        # Rules analyzed at once when calling the API once per rule
+        self.concurrency = max(1, int(concurrency or 1))
         self.category_name = self.CATEGORY_NAMES.get(category, category)
 
     def generate_report(self) -> dict:
@@ -66,12 +147,12 @@ class ProofreadingReportGenerator:
         if self.logger:
             self.logger.info(f"Found {len(rules)} rule files to analyze")
 
-        findings = []
-        for i, (rule_file, content) in enumerate(rules):
-            if self.logger:
-                self.logger.info(f"Analyzing {rule_file} ({i + 1}/{len(rules)})")
-            result = self._analyze_rule(rule_file, content)
-            findings.append(result)
+        findings = None
+        if self.batch_min_rules and len(rules) >= self.batch_min_rules:
+            findings = self._analyze_batch(rules)
+
+        if findings is None:
+            findings = self._analyze_rules(rules)
 
         report = self._compile_report(findings)
         self._write_markdown_report(report)
@@ -93,101 +174,153 @@ class ProofreadingReportGenerator:
 
     def _analyze_rule(self, filename: str, content: str) -> dict:
         """Send rule to Claude for structured analysis. Returns findings dict."""
-        tools = [{
-            "name": "report_findings",
-            "description": "Report proofreading findings for a court rule.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "has_issues": {
-                        "type": "boolean",
-                        "description": "Whether any issues were found",
-                    },
-                    "findings": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "severity": {
-                                    "type": "string",
-                                    "enum": ["ERROR", "WARNING"],
-                                    "description": "ERROR for clear mistakes, WARNING for potential issues",
-                                },
-                                "category": {
-                                    "type": "string",
-                                    "enum": ["typo", "grammar", "citation", "cross-reference",
-                                             "formatting", "substantive"],
-                                },
-                                "quote": {
-                                    "type": "string",
-                                    "description": "The exact text containing the error",
-                                },
-                                "description": {
-                                    "type": "string",
-                                    "description": "What the error is",
-                                },
-                                "suggestion": {
-                                    "type": "string",
-                                    "description": "Suggested correction, if obvious",
-                                },
-                            },
-                            "required": ["severity", "category", "quote", "description"],
-                        },
-                    },
-                },
-                "required": ["has_issues", "findings"],
-            },
-        }]
-
-        prompt = f"""You are proofreading a published North Dakota court rule.
-Your job is to identify clear errors for a report to the court.
+        try:
+            response = self.client.messages.create(
+                **self._request_params(filename, content)
+            )
+            return self._parse_response(filename, response)
 
-IMPORTANT: Report only genuine errors and strong concerns, NOT stylistic preferences.
-These are published court rules — flag mistakes, not opinions.
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error analyzing {filename}: {e}")
+            return self._empty_result(filename, error=str(e))
 
-Check for:
-1. TYPOS: Misspellings, missing spaces, doubled words, wrong words
-2. GRAMMAR: Subject-verb agreement, sentence fragments, clear grammatical errors
-3. CITATIONS: Incorrect citation format, references to non-existent rules
-4. CROSS-REFERENCES: Rule references that appear wrong
-5. FORMATTING: Inconsistent numbering (e.g., jumps from (a) to (c)), missing subsection labels
-6. SUBSTANTIVE: Contradictory provisions, ambiguous "this" without antecedent, potential drafting errors
+    def _analyze_rules(self, rules: List[Tuple[str, str]]) -> List[dict]:
+        """Analyze rules with one direct API call each, in rule order."""
+        def analyze(indexed_rule):
+            i, (rule_file, content) = indexed_rule
+            if self.logger:
+                self.logger.info(f"Analyzing {rule_file} ({i + 1}/{len(rules)})")
+            return self._analyze_rule(rule_file, content)
+
+        # The client is thread-safe and each call is almost all waiting,
+        # so overlap them; map keeps the results in rule order
+        workers = max(1, min(self.concurrency, len(rules)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(analyze, enumerate(rules)))
+
+    def _analyze_batch(self, rules: List[Tuple[str, str]]) -> Optional[List[dict]]:
+        """Analyze all rules in one Message Batch, in rule order.
+
+        Batches cost half as much as individual calls but can take several
+        minutes, so the batch is polled every _BATCH_POLL_INTERVAL seconds.
+        Failed status and result calls are retried with backoff; if they keep
+        failing the batch is canceled. Only rules without a batch result are
+        then analyzed with direct calls. Returns None if the batch could not
+        be submitted, so the caller can analyze every rule directly.
+        """
+        # custom_id only allows [a-zA-Z0-9_-], so requests are keyed by position
+        requests = [
+            {
+                'custom_id': f"rule-{i}",
+                'params': self._request_params(filename, content),
+            }
+            for i, (filename, content) in enumerate(rules)
+        ]
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Batch submission failed, analyzing rules individually: {e}")
+            return None
 
-Use the report_findings tool to report your results. If the rule has no issues, call the tool with has_issues=false and an empty findings array.
+        batch_id = batch.id
+        if self.logger:
+            self.logger.info(f"Submitted batch {batch_id} with {len(requests)} rules")
+        try:
+            while batch.processing_status != 'ended':
+                time.sleep(self._BATCH_POLL_INTERVAL)
+                batch = self._retry_batch_call(
+                    lambda: self.client.messages.batches.retrieve(batch_id)
+                )
+                if self.logger:
+                    self.logger.debug(
+                        f"Batch {batch_id}: {batch.request_counts.processing} "
+                        f"of {len(requests)} rules still processing"
+                    )
+            messages = self._retry_batch_call(lambda: self._batch_messages(batch_id))
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Giving up on batch {batch_id}: {e}")
+            # Stop the batch so it isn't billed for rules about to be sent directly
+            try:
+                self.client.messages.batches.cancel(batch_id)
+            except Exception as cancel_error:
+                if self.logger:
+                    self.logger.warning(f"Failed to cancel batch {batch_id}: {cancel_error}")
+            messages = {}
+
+        missing = [i for i in range(len(rules)) if f"rule-{i}" not in messages]
+        if missing and self.logger:
+            self.logger.warning(
+                f"{len(missing)} of {len(rules)} rules have no batch result, "
+                f"analyzing them individually"
+            )
+        retried = dict(zip(missing, self._analyze_rules([rules[i] for i in missing])))
 
-RULE FILE: {filename}
+        findings = []
+        for i, (filename, content) in enumerate(rules):
+            if i in retried:
+                findings.append(retried[i])
+            else:
+                findings.append(self._parse_response(filename, messages[f"rule-{i}"]))
+        return findings
+
+    def _batch_messages(self, batch_id: str) -> Dict[str, object]:
+        """Collect the messages of an ended batch's succeeded requests by custom_id."""
+        messages = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type == 'succeeded':
+                messages[entry.custom_id] = entry.result.message
+        return messages
+
+    def _retry_batch_call(self, call):
+        """Return call(), retrying failures with capped exponential backoff.
+
+        Re-raises the last error once _BATCH_MAX_RETRIES retries have failed.
+        """
+        for attempt in range(self._BATCH_MAX_RETRIES + 1):
+            try:
+                return call()
+            except Exception as e:
+                if attempt == self._BATCH_MAX_RETRIES:
+                    raise
+                delay = min(self._BATCH_POLL_INTERVAL * 2 ** attempt, self._BATCH_BACKOFF_MAX)
+                if self.logger:
+                    self.logger.warning(f"Batch API call failed ({e}), retrying in {delay}s")
+                time.sleep(delay)
+
+    def _request_params(self, filename: str, content: str) -> dict:
+        """Build the Messages API parameters for analyzing one rule."""
+        prompt = f"""RULE FILE: {filename}
 
 RULE TEXT:
 {content}"""
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                tools=tools,
-                tool_choice={"type": "tool", "name": "report_findings"},
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Extract tool use result
-            for block in response.content:
-                if block.type == "tool_use" and block.name == "report_findings":
-                    tool_input = block.input
-                    return {
-                        'filename': filename,
-                        'rule_number': self._filename_to_rule_number(filename),
-                        'has_issues': tool_input.get('has_issues', False),
-                        'findings': tool_input.get('findings', []),
-                    }
+        return {
+            'model': self.model,
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'tools': self._TOOLS,
+            'tool_choice': {"type": "tool", "name": "report_findings"},
+            'system': self._INSTRUCTIONS,
+            'messages': [{"role": "user", "content": prompt}],
+        }
 
-            # Fallback if no tool use found
-            return self._empty_result(filename)
+    def _parse_response(self, filename: str, response) -> dict:
+        """Extract the report_findings tool call from a Messages API response."""
+        for block in response.content:
+            if block.type == "tool_use" and block.name == "report_findings":
+                tool_input = block.input
+                return {
+                    'filename': filename,
+                    'rule_number': self._filename_to_rule_number(filename),
+                    'has_issues': tool_input.get('has_issues', False),
+                    'findings': tool_input.get('findings', []),
+                }
 
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error analyzing {filename}: {e}")
-            return self._empty_result(filename, error=str(e))
+        # Fallback if no tool use found
+        return self._empty_result(filename)
 
     def _empty_result(self, filename: str, error: Optional[str] = None) -> dict:
         result = {
@@ -336,10 +469,10 @@ RULE TEXT:
 
         report_path = Path(self.report_dir) / 'proofreading-report.json'
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(
-            json.dumps(json_report, indent=2, ensure_ascii=False) + '\n',
-            encoding='utf-8',
-        )
+        # Stream into a large buffer rather than building the whole document as one string
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(json_report, f, indent=2, ensure_ascii=False)
+            f.write('\n')
 
         if self.logger:
             self.logger.info(f"JSON report written to {report_path}")
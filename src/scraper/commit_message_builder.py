@@ -5,14 +5,32 @@ relevant explanatory notes and committee minutes summaries.
 Falls back to regex-based trimming when no API key is available.
 """
 
+import hashlib
+import json
 import os
 import re
 from datetime import date
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from scraper.committee_minutes_fetcher import CommitteeMinutesFetcher
 
 
+_MONTHS = (
+    r'(?:January|February|March|April|May|June|July|August|'
+    r'September|October|November|December)'
+)
+# SOURCES paragraph of the explanatory notes and the meeting dates it cites
+_SOURCES_RE = re.compile(r'SOURCES?:(.+)', re.DOTALL | re.IGNORECASE)
+_SOURCES_PREFIX_RE = re.compile(r'SOURCES?:', re.IGNORECASE)
+_LINKED_DATE_RE = re.compile(r'\[([^\]]+)\]\(https?://[^)]*committee[^)]*\)', re.IGNORECASE)
+_UNLINKED_DATE_RE = re.compile(_MONTHS + r'\s+\d{1,2}(?:-\d{1,2})?,\s*\d{4}')
+_DAY_RANGE_RE = re.compile(r'(\d{1,2})-\d{1,2}')
+# Used by the regex fallback to classify explanatory-note paragraphs
+_AMENDMENT_SUMMARY_RE = re.compile(r'was (?:amended|adopted|approved)', re.IGNORECASE)
+_EFFECTIVE_MONTH_RE = re.compile(r'effective\s+' + _MONTHS, re.IGNORECASE)
+_FULL_DATE_RE = re.compile(_MONTHS + r'\s+\d{1,2},\s*\d{4}')
+
+
 class CommitMessageBuilder:
     """Builds focused commit messages for each rule version."""
 
@@ -24,6 +42,7 @@ class CommitMessageBuilder:
         max_tokens: int = 1000,
         temperature: float = 0.1,
         logger=None,
+        cache_dir: Optional[str] = None,
     ):
         self.client = anthropic_client
         self.committee_fetcher = committee_fetcher
@@ -31,6 +50,9 @@ class CommitMessageBuilder:
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.logger = logger
+        # Haiku results, on disk across runs (if cache_dir is set) and in memory
+        self.cache_dir = cache_dir
+        self._haiku_results: Dict[str, str] = {}
 
     def build_message(
         self,
@@ -116,26 +138,21 @@ class CommitMessageBuilder:
         dates = []
 
         # Find the SOURCES paragraph
-        sources_match = re.search(r'SOURCES?:(.+)', explanatory_notes, re.DOTALL | re.IGNORECASE)
+        sources_match = _SOURCES_RE.search(explanatory_notes)
         if not sources_match:
             return dates
 
         sources_text = sources_match.group(1)
 
         # Extract linked dates: [date text](url)
-        linked_pattern = r'\[([^\]]+)\]\(https?://[^)]*committee[^)]*\)'
-        for match in re.finditer(linked_pattern, sources_text, re.IGNORECASE):
+        for match in _LINKED_DATE_RE.finditer(sources_text):
             parsed = self._parse_date_text(match.group(1))
             if parsed:
                 dates.append(parsed)
 
         # Extract unlinked dates: month day(-day), year patterns
         # Match patterns like "February 17-18, 1983" or "September 30, 2021"
-        unlinked_pattern = (
-            r'(?:January|February|March|April|May|June|July|August|'
-            r'September|October|November|December)\s+\d{1,2}(?:-\d{1,2})?,\s*\d{4}'
-        )
-        for match in re.finditer(unlinked_pattern, sources_text):
+        for match in _UNLINKED_DATE_RE.finditer(sources_text):
             parsed = self._parse_date_text(match.group(0))
             if parsed and parsed not in dates:
                 dates.append(parsed)
@@ -148,7 +165,7 @@ class CommitMessageBuilder:
         Uses the first date in any range.
         """
         # Normalize: remove range part (e.g., "-30" in "29-30")
-        cleaned = re.sub(r'(\d{1,2})-\d{1,2}', r'\1', text.strip())
+        cleaned = _DAY_RANGE_RE.sub(r'\1', text.strip())
 
         # Try common formats
         for fmt in ("%B %d, %Y", "%b %d, %Y", "%B %d %Y"):
@@ -233,6 +250,16 @@ EXPLANATORY NOTES:
 COMMITTEE MINUTES:
 {minutes_section}"""
 
+        # The prompt holds every input (rule, date, notes, minutes), so it and
+        # the model settings identify the result. Rebuilds reuse it rather than
+        # paying for the same call again.
+        cache_key = hashlib.sha256(json.dumps(
+            [self.haiku_model, self.max_tokens, self.temperature, prompt]
+        ).encode("utf-8")).hexdigest()
+        cached = self._read_cache(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.messages.create(
                 model=self.haiku_model,
@@ -247,6 +274,7 @@ COMMITTEE MINUTES:
             if not result or len(result) < 10:
                 return None
 
+            self._write_cache(cache_key, result)
             return result
 
         except Exception as e:
@@ -257,6 +285,41 @@ COMMITTEE MINUTES:
                 )
             return None
 
+    def _read_cache(self, cache_key: str) -> Optional[str]:
+        """Return a cached Haiku result, from memory or disk."""
+        if cache_key in self._haiku_results:
+            return self._haiku_results[cache_key]
+        if not self.cache_dir:
+            return None
+        cache_path = os.path.join(self.cache_dir, f"{cache_key}.txt")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                result = f.read()
+        except OSError:
+            return None
+        self._haiku_results[cache_key] = result
+        return result
+
+    def _write_cache(self, cache_key: str, result: str) -> None:
+        """Remember a Haiku result; written atomically like the minutes cache."""
+        self._haiku_results[cache_key] = result
+        if not self.cache_dir:
+            return
+        cache_path = os.path.join(self.cache_dir, f"{cache_key}.txt")
+        tmp_path = f"{cache_path}.tmp.{os.getpid()}"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(result.encode("utf-8"))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Failed to cache commit message: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _regex_trim(self, explanatory_notes: str, effective_date: date) -> str:
         """
         Fallback: regex-based paragraph filtering for when Haiku is unavailable.
@@ -278,14 +341,14 @@ COMMITTEE MINUTES:
                 continue
 
             # Skip the opening summary that lists all amendment dates
-            if i == 0 and re.search(r'was (?:amended|adopted|approved)', para_stripped, re.IGNORECASE):
+            if i == 0 and _AMENDMENT_SUMMARY_RE.search(para_stripped):
                 # Check if it also has specific content beyond just listing dates
                 # If it mentions our date specifically in a substantive way, keep it
                 if not any(ds in para_stripped for ds in date_strs):
                     continue
 
             # Skip SOURCES paragraph
-            if re.match(r'SOURCES?:', para_stripped, re.IGNORECASE):
+            if _SOURCES_PREFIX_RE.match(para_stripped):
                 continue
 
             # Keep paragraphs that mention this effective date
@@ -294,9 +357,9 @@ COMMITTEE MINUTES:
                 continue
 
             # Keep undated general guidance paragraphs (no "effective" keyword)
-            if not re.search(r'effective\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)', para_stripped, re.IGNORECASE):
+            if not _EFFECTIVE_MONTH_RE.search(para_stripped):
                 # But skip if it clearly references a different specific date
-                if not re.search(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s*\d{4}', para_stripped):
+                if not _FULL_DATE_RE.search(para_stripped):
                     kept.append(para_stripped)
 
         return "\n\n".join(kept) if kept else ""
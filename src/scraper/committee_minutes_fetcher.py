@@ -45,6 +45,8 @@ class CommitteeMinutesFetcher:
         self.request_delay = request_delay
         self._meetings_by_date: Dict[date, MeetingRecord] = {}
         self._index_loaded = False
+        # Results for this run, including misses, keyed by requested date
+        self._text_by_date: Dict[date, Optional[str]] = {}
 
     def load_meeting_index(self) -> None:
         """Fetch the meeting list JSON API and build the date lookup table."""
@@ -96,7 +98,9 @@ class CommitteeMinutesFetcher:
         Fetch and extract text from committee minutes for a given meeting date.
 
         Uses fuzzy matching (+-1 day) to handle multi-day meetings.
-        Results are cached permanently as text files.
+        Results are cached permanently as text files. Every answer, including
+        "no minutes", is also remembered for the rest of the run, since many
+        rules amended together cite the same meeting.
 
         Args:
             meeting_date: The date of the committee meeting
@@ -104,6 +108,14 @@ class CommitteeMinutesFetcher:
         Returns:
             Extracted text from the minutes PDF, or None if unavailable
         """
+        if meeting_date in self._text_by_date:
+            return self._text_by_date[meeting_date]
+        text = self._fetch_minutes_text(meeting_date)
+        self._text_by_date[meeting_date] = text
+        return text
+
+    def _fetch_minutes_text(self, meeting_date: date) -> Optional[str]:
+        """Look up minutes text in the disk cache, else download and extract it."""
         self.load_meeting_index()
 
         # Check cache first
@@ -115,9 +127,7 @@ class CommitteeMinutesFetcher:
         record = self._find_meeting(meeting_date)
         if record is None:
             if self.logger:
-                self.logger.debug(
-                    f"No meeting found for date {meeting_date}"
-                )
+                self.logger.debug("No meeting found for date %s", meeting_date)
             return None
 
         # Try to download the minutes PDF
@@ -133,9 +143,7 @@ class CommitteeMinutesFetcher:
 
         if not pdf_url:
             if self.logger:
-                self.logger.debug(
-                    f"No minutes PDF available for {meeting_date}"
-                )
+                self.logger.debug("No minutes PDF available for %s", meeting_date)
             return None
 
         # Download and extract text
@@ -264,12 +272,23 @@ class CommitteeMinutesFetcher:
         return None
 
     def _write_cache(self, meeting_date: date, text: str) -> None:
-        """Write extracted text to cache."""
+        """Write extracted text to cache.
+
+        Cache entries are trusted forever, so the text is written to a temp
+        file in one call and atomically renamed into place; an interrupted
+        run can't leave a truncated entry behind.
+        """
         os.makedirs(self.cache_dir, exist_ok=True)
         cache_path = os.path.join(self.cache_dir, f"{meeting_date.isoformat()}.txt")
+        tmp_path = f"{cache_path}.tmp.{os.getpid()}"
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                f.write(text)
+            with open(tmp_path, "wb") as f:
+                f.write(text.encode("utf-8"))
+            os.replace(tmp_path, cache_path)
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"Failed to write cache for {meeting_date}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
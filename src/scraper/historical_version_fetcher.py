@@ -5,6 +5,7 @@ Downloads all historical versions of a rule and converts them to markdown.
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from typing import List, Optional
@@ -14,6 +15,7 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from scraper.version_history_extractor import VersionHistory, RuleVersion
+from utils.rate_limiter import RateLimiter
 
 
 # Pattern matching /legal-resources/rules/{category}/{slug}
@@ -78,61 +80,100 @@ def _wrap_emphasis(text: str, marker: str) -> str:
 class HistoricalVersionFetcher:
     """Fetches and converts all historical versions of a rule."""
 
-    def __init__(self, session: requests.Session, logger=None, request_delay: float = 1.0):
+    def __init__(
+        self,
+        session: requests.Session,
+        logger=None,
+        request_delay: float = 1.0,
+        max_workers: int = 1,
+    ):
         self.session = session
         self.logger = logger
         self.request_delay = request_delay
+        self.max_workers = max(1, int(max_workers or 1))
 
     def fetch_all_versions(
-        self, version_history: VersionHistory
+        self, version_history: VersionHistory, limiter: Optional[RateLimiter] = None
     ) -> List[RuleVersionContent]:
         """
         Download and parse all versions of a rule chronologically.
 
+        With max_workers > 1 the versions are fetched by a thread pool whose
+        requests still start at least request_delay apart, so only the
+        round-trips overlap; results keep the version order either way.
+
         Args:
             version_history: VersionHistory with sorted version list
+            limiter: Pacing shared with other callers fetching versions at the
+                same time; every request waits on it instead of sleeping
+                request_delay between its own requests
 
         Returns:
             List of RuleVersionContent, oldest first
         """
-        results = []
+        versions = version_history.versions
+        workers = min(self.max_workers, len(versions))
 
-        for i, version in enumerate(version_history.versions):
-            if self.logger:
-                self.logger.info(
-                    f"  Fetching version {i + 1}/{len(version_history.versions)} "
-                    f"(effective {version.effective_date}) for Rule {version_history.rule_number}"
-                )
+        if workers > 1:
+            if limiter is None:
+                limiter = RateLimiter(self.request_delay)
+
+            def fetch(indexed_version):
+                i, version = indexed_version
+                limiter.wait()
+                return self._fetch_numbered(i, version, version_history)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(fetch, enumerate(versions)))
+            return [content for content in fetched if content]
+
+        results = []
 
-            content = self.fetch_version(version, version_history)
+        for i, version in enumerate(versions):
+            if limiter is not None:
+                limiter.wait()
+            content = self._fetch_numbered(i, version, version_history)
             if content:
                 results.append(content)
-            else:
-                if self.logger:
-                    self.logger.warning(
-                        f"  Failed to fetch version {version.url}"
-                    )
 
             # Respectful delay between requests
-            if i < len(version_history.versions) - 1:
+            if limiter is None and i < len(versions) - 1:
                 time.sleep(self.request_delay)
 
         return results
 
+    def _fetch_numbered(
+        self, i: int, version: RuleVersion, history: VersionHistory
+    ) -> Optional[RuleVersionContent]:
+        """Fetch the i-th version of a rule, logging progress and failures."""
+        if self.logger:
+            self.logger.info(
+                "  Fetching version %d/%d (effective %s) for Rule %s",
+                i + 1, len(history.versions),
+                version.effective_date, history.rule_number,
+            )
+
+        content = self.fetch_version(version, history)
+        if not content and self.logger:
+            self.logger.warning(
+                f"  Failed to fetch version {version.url}"
+            )
+        return content
+
     def fetch_version(
         self, version: RuleVersion, history: VersionHistory
     ) -> Optional[RuleVersionContent]:
         """Fetch a single version and convert to markdown."""
         try:
-            response = self.session.get(version.url, timeout=30)
-            if response.status_code != 200:
-                if self.logger:
-                    self.logger.warning(
-                        f"HTTP {response.status_code} for {version.url}"
-                    )
-                return None
-
-            html = response.text
+            with self.session.get(version.url, timeout=30) as response:
+                if response.status_code != 200:
+                    if self.logger:
+                        self.logger.warning(
+                            f"HTTP {response.status_code} for {version.url}"
+                        )
+                    return None
+                html = response.text
+
             soup = BeautifulSoup(html, 'html.parser')
 
             title = self._extract_title(soup, history.rule_title)
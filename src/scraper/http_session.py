@@ -0,0 +1,82 @@
+"""
+HTTP session setup for the ND Court Rules Scraper.
+Builds the shared requests.Session used for all ndcourts.gov fetches.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Throttling and transient server errors worth retrying (a 429's Retry-After
+# is honoured). 404/410 and other client errors are returned straight away.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Backoff doubles from 0.5s per attempt but never waits longer than this
+_BACKOFF_FACTOR = 0.5
+_BACKOFF_MAX = 8
+
+# requests' own default; the pool only grows past it when more threads than
+# this can be fetching at once
+_MIN_POOL_SIZE = 10
+
+
+def create_session(config: dict) -> requests.Session:
+    """
+    Create a session with the scraper's headers and retry policy.
+
+    GET requests that fail to connect, time out, or return 429/5xx are
+    retried up to scraping.max_retries times with capped exponential backoff.
+    Once retries are exhausted the last response is returned as-is, so
+    callers keep seeing the status code rather than an exception.
+
+    Everything goes to one host, so the connection pool is sized to hold a
+    keep-alive connection for every thread that can fetch at once
+    (categories in parallel × rule workers per category). Otherwise urllib3
+    discards the surplus connections and new ones pay the TLS handshake again.
+    scraping.pool_maxsize overrides the computed size.
+
+    Args:
+        config: Parsed configuration dictionary
+
+    Returns:
+        Configured requests.Session
+    """
+    scraping_config = config.get('scraping', {})
+    vh_config = config.get('version_history', {})
+
+    session = requests.Session()
+    user_agent = scraping_config.get(
+        'user_agent', 'ND-Court-Rules-Scraper/1.0 (Educational Project)'
+    )
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Connection': 'keep-alive',
+    })
+    try:
+        import certifi
+        session.verify = certifi.where()
+    except ImportError:
+        session.verify = False
+
+    retry = Retry(
+        total=scraping_config.get('max_retries', 3),
+        backoff_factor=_BACKOFF_FACTOR,
+        backoff_max=_BACKOFF_MAX,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=('GET',),
+        raise_on_status=False,
+    )
+    concurrent_fetches = (
+        int(scraping_config.get('max_concurrency', 1) or 1)
+        * int(vh_config.get('max_workers', 4) or 1)
+        * int(vh_config.get('version_workers', 1) or 1)
+    )
+    pool_size = int(
+        scraping_config.get('pool_maxsize') or max(_MIN_POOL_SIZE, concurrent_fetches)
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
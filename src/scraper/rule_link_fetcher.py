@@ -8,7 +8,23 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+from scraper.rule_sort import rule_number_key
+
+# lxml's C parser when installed (it is in requirements.txt). Only the <a> and
+# <option> elements are built, since those are all the index is searched for.
+_PARSER = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+_LINK_TAGS = SoupStrainer(['a', 'option'])
+
+# Strict rule URL pattern: /legal-resources/rules/{category}/{slug}
+# Matches numeric (28), hyphenated (6-1), and appendix (appendix-a) slugs.
+# The $ anchor prevents matching sub-pages like /9/appendix-jury-standards.
+_RULE_HREF_RE = re.compile(r'/legal-resources/rules/[a-z]+/([\w][\w-]*)$')
+
+# Links under the rules tree that aren't rules
+_BLACKLIST = ('committee', 'tables', 'joint', 'meeting')
 
 
 def fetch_rule_links(
@@ -40,26 +56,24 @@ def fetch_rule_links(
             logger.error(f"Request error for category page: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(
+        response.content, _PARSER,
+        parse_only=_LINK_TAGS, from_encoding=response.encoding,
+    )
     rule_links = []
     seen_urls = set()
 
     # Extract rule links from the page
     for link in soup.find_all('a', href=True):
         href = link.get('href', '')
-        text = link.get_text().strip()
 
-        # Use strict URL pattern: /legal-resources/rules/{category}/{slug}
-        # Matches numeric (28), hyphenated (6-1), and appendix (appendix-a) slugs.
-        # The $ anchor prevents matching sub-pages like /9/appendix-jury-standards.
-        pattern = r'/legal-resources/rules/[a-z]+/([\w][\w-]*)$'
-        match = re.search(pattern, href)
+        match = _RULE_HREF_RE.search(href)
         if not match:
             continue
 
         # Skip blacklisted paths
         href_lower = href.lower()
-        if any(kw in href_lower for kw in ['committee', 'tables', 'joint', 'meeting']):
+        if any(kw in href_lower for kw in _BLACKLIST):
             continue
 
         full_url = urljoin('https://www.ndcourts.gov', href)
@@ -69,22 +83,20 @@ def fetch_rule_links(
 
         rule_links.append({
             'url': full_url,
-            'title': text,
+            'title': link.get_text().strip(),
             'rule_number': match.group(1),
         })
 
     # Also check the <select> dropdown which has all rules listed
     for option in soup.find_all('option', value=True):
         href = option.get('value', '')
-        text = option.get_text().strip()
 
-        pattern = r'/legal-resources/rules/[a-z]+/([\w][\w-]*)$'
-        match = re.search(pattern, href)
+        match = _RULE_HREF_RE.search(href)
         if not match:
             continue
 
         href_lower = href.lower()
-        if any(kw in href_lower for kw in ['committee', 'tables', 'joint', 'meeting']):
+        if any(kw in href_lower for kw in _BLACKLIST):
             continue
 
         full_url = href if href.startswith('http') else urljoin('https://www.ndcourts.gov', href)
@@ -94,25 +106,11 @@ def fetch_rule_links(
 
         rule_links.append({
             'url': full_url,
-            'title': text,
+            'title': option.get_text().strip(),
             'rule_number': match.group(1),
         })
 
     # Sort by rule number: numeric first, then non-numeric (appendices)
-    def _sort_key(r):
-        rn = r['rule_number']
-        # Try pure numeric
-        try:
-            return (0, float(rn), '')
-        except ValueError:
-            pass
-        # Try hyphenated numeric like "6-1" -> (0, 6.0, '1')
-        parts = rn.split('-')
-        if parts[0].isdigit():
-            return (0, float(parts[0]), '-'.join(parts[1:]))
-        # Non-numeric (appendix-a) -> sort after all numeric rules
-        return (1, 0, rn)
-
-    rule_links.sort(key=_sort_key)
+    rule_links.sort(key=lambda r: rule_number_key(r['rule_number']))
 
     return rule_links
@@ -0,0 +1,42 @@
+"""
+Rule ordering for the ND Court Rules Scraper.
+Sort keys shared by the rule-link fetcher and both orchestrators.
+"""
+
+import functools
+import re
+
+# "28", "2.1"
+_NUMERIC_RE = re.compile(r'\d+(?:\.\d+)?')
+# "6-1", "10-1-2": leading number, then the rest
+_HYPHENATED_RE = re.compile(r'(\d+)-(.*)', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=4096)
+def rule_number_key(rule_number: str) -> tuple:
+    """
+    Sort key for a rule number: numeric rules first, then everything else.
+
+    Rule numbers repeat across every version of a rule, so the parsed key is
+    cached rather than re-derived for each version being sorted. Parsing is
+    by regex, so non-numeric rule numbers don't raise and catch a ValueError.
+
+    Examples:
+        "28"         -> (0, 28.0, '')
+        "2.1"        -> (0, 2.1, '')
+        "6-1"        -> (0, 6.0, '1')
+        "appendix-a" -> (1, 0, 'appendix-a')
+    """
+    if _NUMERIC_RE.fullmatch(rule_number):
+        return (0, float(rule_number), '')
+    # Hyphenated numeric like "6-1" -> (0, 6.0, '1')
+    match = _HYPHENATED_RE.fullmatch(rule_number)
+    if match:
+        return (0, float(match.group(1)), match.group(2))
+    # Non-numeric (appendix-a) -> sort after all numeric rules
+    return (1, 0, rule_number)
+
+
+def version_sort_key(content) -> tuple:
+    """Sort key for a RuleVersionContent: effective date, then rule number."""
+    return (content.effective_date,) + rule_number_key(content.rule_number)
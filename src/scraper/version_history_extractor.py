@@ -6,9 +6,15 @@ Parses version history tables and explanatory notes from rule HTML pages.
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Union
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# lxml's C parser when installed (it is in requirements.txt); the extractor
+# only reads the title, version table and notes, which both parsers agree on
+_PARSER = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
 
 
 @dataclass
@@ -31,6 +37,18 @@ class VersionHistory:
     explanatory_notes: str = ""
     total_versions: int = 0
 
+    @cached_property
+    def _date_index(self) -> Dict[date, int]:
+        # Built back to front so the earliest version wins on a duplicate date
+        return {
+            v.effective_date: i
+            for i, v in reversed(list(enumerate(self.versions)))
+        }
+
+    def index_of_date(self, effective_date: date) -> Optional[int]:
+        """Return the index of the first version effective on a date, or None."""
+        return self._date_index.get(effective_date)
+
 
 class VersionHistoryExtractor:
     """Extracts version history and explanatory notes from rule HTML pages."""
@@ -40,18 +58,29 @@ class VersionHistoryExtractor:
     def __init__(self, logger=None):
         self.logger = logger
 
-    def extract_version_history(self, html_content: str, rule_url: str) -> VersionHistory:
+    def extract_version_history(
+        self,
+        html_content: Union[str, bytes],
+        rule_url: str,
+        encoding: Optional[str] = None,
+    ) -> VersionHistory:
         """
         Extract complete version history from a rule page.
 
         Args:
-            html_content: Raw HTML of the rule page
+            html_content: Raw HTML of the rule page, as text or as the
+                undecoded response body
             rule_url: URL of the current rule page
+            encoding: Encoding of a bytes body (pass response.encoding so it
+                decodes exactly as response.text would); ignored for str
 
         Returns:
             VersionHistory with all versions and explanatory notes
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if isinstance(html_content, bytes):
+            soup = BeautifulSoup(html_content, _PARSER, from_encoding=encoding)
+        else:
+            soup = BeautifulSoup(html_content, _PARSER)
 
         rule_title = self._extract_title(soup)
         rule_number = self._extract_rule_number(rule_title, rule_url)
@@ -85,7 +114,7 @@ class VersionHistoryExtractor:
 
         if self.logger:
             self.logger.info(
-                f"Extracted {len(versions)} versions for Rule {rule_number}: {rule_title}"
+                "Extracted %d versions for Rule %s: %s", len(versions), rule_number, rule_title
             )
 
         return history
@@ -2,6 +2,8 @@
 Utility modules for the ND Court Rules Scraper.
 """
 
+from .config_loader import load_config, load_config_or_defaults
 from .logger import ScraperLogger, get_logger
+from .rate_limiter import RateLimiter
 
-__all__ = ['ScraperLogger', 'get_logger']
+__all__ = ['ScraperLogger', 'get_logger', 'load_config', 'load_config_or_defaults', 'RateLimiter']
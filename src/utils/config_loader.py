@@ -0,0 +1,71 @@
+"""
+Configuration loading for the ND Court Rules Scraper.
+Parses config.yaml with the libyaml-backed loader when PyYAML was built with it.
+"""
+
+import copy
+import functools
+import os
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime_ns: int, size: int):
+    """Parse a config file; the stat fields only key the cache."""
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_config(config_path: str) -> dict:
+    """
+    Parse a YAML configuration file.
+
+    Uses the C-accelerated safe loader when available, falling back to the
+    pure-Python SafeLoader. Both accept the same documents as yaml.safe_load.
+    The file is handed to the parser as bytes; YAML detects the encoding
+    itself, so there is no separate text-decoding pass.
+
+    Parsed results are cached by path, modification time and size, so
+    repeated loads of an unchanged file skip the parse. Each call returns
+    its own copy, so callers may modify it freely.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Parsed configuration (None for an empty file, as with yaml.safe_load)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    st = os.stat(config_path)
+    return copy.deepcopy(_parse_config(os.path.abspath(config_path), st.st_mtime_ns, st.st_size))
+
+
+def load_config_or_defaults(config_path: str) -> dict:
+    """
+    Parse a YAML configuration file, falling back to an empty config.
+
+    Prints a warning and returns {} if the file is missing or invalid.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    try:
+        return load_config(config_path) or {}
+    except FileNotFoundError:
+        print(f"Warning: Config file {config_path} not found. Using defaults.")
+        return {}
+    except yaml.YAMLError as e:
+        print(f"Error parsing config file: {e}")
+        return {}
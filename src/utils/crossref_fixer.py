@@ -5,9 +5,10 @@ Scans rule markdown files and converts absolute ND Courts URLs to relative
 local links where a matching file exists on disk.
 """
 
+import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 
 
 # Matches markdown links with absolute rule paths:
@@ -43,28 +44,41 @@ class CrossReferenceFixer:
         else:
             self.rules_dir = self.repo_dir
 
+        # Number of links rewritten per changed file, filled in by scan()
+        self.link_counts: Dict[str, int] = {}
+
+        # File names per target directory, listed once instead of a stat() per link
+        self._dir_listings: Dict[Path, Optional[FrozenSet[str]]] = {}
+
     def scan(self) -> dict:
         """Scan all rule files and compute fixes.
 
         Returns:
             Dict mapping relative file paths to new content for files that changed.
+            The number of links rewritten in each is recorded in self.link_counts.
         """
         changes = {}
+        self.link_counts = {}
 
         for filepath in sorted(self.rules_dir.glob('rule-*.md')):
             original = filepath.read_text(encoding='utf-8')
-            fixed = self._fix_links(original)
+            fixed, link_count = self._fix_links(original)
 
             if fixed != original:
                 # Use path relative to repo root for git operations
                 rel_path = str(filepath.relative_to(self.repo_dir))
                 changes[rel_path] = fixed
+                self.link_counts[rel_path] = link_count
 
         return changes
 
-    def _fix_links(self, content: str) -> str:
-        """Replace absolute rule links with relative ones where possible."""
-        return _LINK_RE.sub(self._replace_link, content)
+    def _fix_links(self, content: str) -> tuple:
+        """Replace absolute rule links with relative ones where possible.
+
+        Returns:
+            Tuple of (new content, number of links replaced).
+        """
+        return _LINK_RE.subn(self._replace_link, content)
 
     def _replace_link(self, match: re.Match) -> str:
         """Replace a single link match."""
@@ -103,24 +117,33 @@ class CrossReferenceFixer:
             # Standalone mode, cross-category: check sibling directory
             target_dir = self.rules_dir.parent / link_category
 
-        if not target_dir.exists():
+        names = self._list_dir(target_dir)
+        if names is None:
             return None
 
         # Try exact slug match first: rule-{slug}.md
-        candidate = target_dir / f"rule-{slug}.md"
-        if candidate.exists():
+        if f"rule-{slug}.md" in names:
             return self._make_relative(link_category, f"rule-{slug}.md", same_category)
 
         # Try dotted variant: 6-1 → 6.1
         dot_match = _DOTTED_SLUG_RE.match(slug)
         if dot_match:
             dotted = f"{dot_match.group(1)}.{dot_match.group(2)}"
-            candidate = target_dir / f"rule-{dotted}.md"
-            if candidate.exists():
+            if f"rule-{dotted}.md" in names:
                 return self._make_relative(link_category, f"rule-{dotted}.md", same_category)
 
         return None
 
+    def _list_dir(self, target_dir: Path) -> Optional[FrozenSet[str]]:
+        """Return the file names in target_dir (cached), or None if it doesn't exist."""
+        if target_dir not in self._dir_listings:
+            try:
+                with os.scandir(target_dir) as it:
+                    self._dir_listings[target_dir] = frozenset(entry.name for entry in it)
+            except (FileNotFoundError, NotADirectoryError):
+                self._dir_listings[target_dir] = None
+        return self._dir_listings[target_dir]
+
     def _make_relative(self, link_category: str, filename: str, same_category: bool) -> str:
         """Build a relative link path."""
         if same_category:
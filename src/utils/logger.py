@@ -7,35 +7,31 @@ import logging
 import sys
 from pathlib import Path
 from typing import Optional
-import yaml
+
+from .config_loader import load_config_or_defaults
 
 
 class ScraperLogger:
     """Custom logger for the scraper with verbose debugging capabilities."""
     
-    def __init__(self, config_path: str = "config.yaml", verbose: bool = False):
+    def __init__(self, config_path: str = "config.yaml", verbose: bool = False,
+                 config: Optional[dict] = None):
         """
         Initialize the logger with configuration.
         
         Args:
             config_path: Path to the configuration file
             verbose: Enable verbose logging regardless of config
+            config: Already-parsed configuration; if given, config_path is not read
         """
-        self.config = self._load_config(config_path)
-        self.verbose = verbose or self.config.get('logging', {}).get('verbose', False)
+        self.config = config if config is not None else self._load_config(config_path)
+        self.logging_config = self.config.get('logging', {})
+        self.verbose = verbose or self.logging_config.get('verbose', False)
         self.logger = self._setup_logger()
     
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            print(f"Warning: Config file {config_path} not found. Using defaults.")
-            return {}
-        except yaml.YAMLError as e:
-            print(f"Error parsing config file: {e}")
-            return {}
+        return load_config_or_defaults(config_path)
     
     def _setup_logger(self) -> logging.Logger:
         """Set up the logger with appropriate handlers and formatters."""
@@ -45,7 +41,7 @@ class ScraperLogger:
         logger.handlers.clear()
         
         # Set log level
-        log_level = self.config.get('logging', {}).get('level', 'INFO')
+        log_level = self.logging_config.get('level', 'INFO')
         if self.verbose:
             log_level = 'DEBUG'
         
@@ -66,7 +62,7 @@ class ScraperLogger:
         logger.addHandler(console_handler)
         
         # File handler for detailed logging
-        log_file = self.config.get('logging', {}).get('log_file', 'scraper.log')
+        log_file = self.logging_config.get('log_file', 'scraper.log')
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(verbose_formatter)
@@ -81,25 +77,29 @@ class ScraperLogger:
         
         return logger
     
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if a message at this level would be handled."""
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args):
+        """Log debug message; %-style args are only formatted if it is emitted."""
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message; %-style args are only formatted if it is emitted."""
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log warning message; %-style args are only formatted if it is emitted."""
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
-        """Log error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        """Log error message; %-style args are only formatted if it is emitted."""
+        self.logger.error(message, *args)
     
-    def critical(self, message: str):
-        """Log critical message."""
-        self.logger.critical(message)
+    def critical(self, message: str, *args):
+        """Log critical message; %-style args are only formatted if it is emitted."""
+        self.logger.critical(message, *args)
     
     def log_request(self, url: str, method: str = "GET", status_code: Optional[int] = None):
         """Log HTTP request details."""
@@ -134,15 +134,17 @@ class ScraperLogger:
             self.error(f"[ERROR] {operation}: {file_path}")
 
 
-def get_logger(config_path: str = "config.yaml", verbose: bool = False) -> ScraperLogger:
+def get_logger(config_path: str = "config.yaml", verbose: bool = False,
+               config: Optional[dict] = None) -> ScraperLogger:
     """
     Get a configured logger instance.
     
     Args:
         config_path: Path to the configuration file
         verbose: Enable verbose logging
+        config: Already-parsed configuration; if given, config_path is not read
     
     Returns:
         Configured ScraperLogger instance
     """
-    return ScraperLogger(config_path, verbose) 
\ No newline at end of file
+    return ScraperLogger(config_path, verbose, config=config) 
\ No newline at end of file
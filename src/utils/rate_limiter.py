@@ -0,0 +1,40 @@
+"""
+Request pacing for the ND Court Rules Scraper.
+Keeps a minimum interval between requests shared by any number of threads.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least min_interval seconds apart."""
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize the limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between successive slots
+        """
+        self.min_interval = max(0.0, float(min_interval))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """
+        Block until the caller's turn.
+
+        Each caller reserves the next free slot under the lock and then
+        sleeps outside it, so with N workers requests still start at most
+        once per min_interval, but a worker never waits on another's request.
+        """
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)